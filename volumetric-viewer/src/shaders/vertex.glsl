@@ -1,6 +1,19 @@
 #version 460 core
 
-layout(location = 0) in vec3 inPosition;
+// Unit cube corners (positions from 0 to 1 in each axis)
+const vec3 CUBE_VERTICES[8] = vec3[8](
+    vec3(0, 0, 0),
+    vec3(1, 0, 0),
+    vec3(1, 1, 0),
+    vec3(0, 1, 0),
+    vec3(0, 0, 1),
+    vec3(1, 0, 1),
+    vec3(1, 1, 1),
+    vec3(0, 1, 1)
+);
+
+// Corners of the cube as a single triangle strip (12 triangles, 14 indices), picked by gl_VertexID
+const int CUBE_STRIP[14] = int[14](7, 6, 3, 2, 1, 6, 5, 7, 4, 3, 0, 1, 4, 5);
 
 uniform mat4 model;
 uniform mat4 view;
@@ -9,6 +22,7 @@ uniform mat4 projection;
 out vec3 fragPos;
 
 void main() {
-    fragPos = inPosition;
-    gl_Position = projection * view * model * vec4(inPosition, 1.0);
+    vec3 position = CUBE_VERTICES[CUBE_STRIP[gl_VertexID]];
+    fragPos = position;
+    gl_Position = projection * view * model * vec4(position, 1.0);
 }
\ No newline at end of file
@@ -1,5 +1,9 @@
+import math
+
 from pyglm import glm
 
+_DEG2RAD = math.pi / 180.0
+
 
 class ArcballCamera:
     """
@@ -17,12 +21,45 @@ class ArcballCamera:
         max_distance (float): Maximum allowed distance to the target.
         up (glm.vec3): World up vector, used to maintain the camera's orientation.
         position (glm.vec3): The current world-space position of the camera.
-        view_matrix (glm.mat4): Cached view matrix based on position and orientation.
+        view_matrix (glm.mat4): View matrix based on position and orientation, cached
+            until yaw, pitch, distance, target, or pending input change it.
+        forward (glm.vec3): Cached unit vector pointing from the camera to the target.
+        right (glm.vec3): Cached unit vector pointing to the camera's right.
+        up_basis (glm.vec3): Cached unit vector pointing up in camera space.
+
+    Input handlers only accumulate their deltas and mark the camera as dirty;
+    assigning ``yaw``, ``pitch``, ``distance``, or ``target`` does the same.
+    The pending input is applied and the position and view matrix are rebuilt
+    lazily the next time ``view_matrix`` is read, so the cost is one rebuild
+    per rendered frame regardless of the input event rate.
     """
 
+    # Fixed attribute layout: no per-instance __dict__, slot-indexed access
+    __slots__ = (
+        "_target",
+        "_distance",
+        "_yaw",
+        "_pitch",
+        "sensitivity",
+        "zoom_speed",
+        "min_distance",
+        "max_distance",
+        "up",
+        "position",
+        "_view_matrix",
+        "forward",
+        "right",
+        "up_basis",
+        "_dirty",
+        "_pending_dx",
+        "_pending_dy",
+        "_pending_scroll",
+        "_pending_pan",
+    )
+
     def __init__(
         self,
-        target: glm.vec3,
+        target: glm.vec3 | None,
         distance: float = 3.0,
         yaw: float = -135.0,
         pitch: float = -30.0,
@@ -31,13 +68,10 @@ class ArcballCamera:
         min_distance: float = 0.1,
         max_distance: float = 100.0,
     ):
-        if target is None:
-            target = glm.vec3(0, 0, 0)
-        else:   
-            self.target = target
-        self.distance = distance
-        self.yaw = yaw
-        self.pitch = pitch
+        self._target = target if target is not None else glm.vec3(0, 0, 0)
+        self._distance = distance
+        self._yaw = yaw
+        self._pitch = pitch
         self.sensitivity = sensitivity
         self.zoom_speed = zoom_speed
         self.min_distance = min_distance
@@ -45,25 +79,114 @@ class ArcballCamera:
 
         self.up = glm.vec3(0, 1, 0)
         self.position = glm.vec3(0)
-        self.view_matrix = glm.mat4(1)
+        self._view_matrix = glm.mat4(1)
+
+        self.forward = glm.vec3(0, 0, -1)
+        self.right = glm.vec3(1, 0, 0)
+        self.up_basis = glm.vec3(0, 1, 0)
+
+        self._dirty = True
+        self._pending_dx = 0.0
+        self._pending_dy = 0.0
+        self._pending_scroll = 0.0
+        self._pending_pan = glm.vec2(0)
+
+    # ======================
+    #   Camera State
+    # ======================
+
+    @property
+    def yaw(self) -> float:
+        """Horizontal rotation angle (in degrees)."""
+        return self._yaw
+
+    @yaw.setter
+    def yaw(self, value: float) -> None:
+        self._yaw = value
+        self._dirty = True
+
+    @property
+    def pitch(self) -> float:
+        """Vertical rotation angle (in degrees)."""
+        return self._pitch
 
-        self.update_camera()
+    @pitch.setter
+    def pitch(self, value: float) -> None:
+        self._pitch = value
+        self._dirty = True
 
-    def update_camera(self) -> None:
+    @property
+    def distance(self) -> float:
+        """Distance from the camera to the target."""
+        return self._distance
+
+    @distance.setter
+    def distance(self, value: float) -> None:
+        self._distance = value
+        self._dirty = True
+
+    @property
+    def target(self) -> glm.vec3:
+        """The point in space the camera orbits around."""
+        return self._target
+
+    @target.setter
+    def target(self, value: glm.vec3) -> None:
+        self._target = value
+        self._dirty = True
+
+    @property
+    def view_matrix(self) -> glm.mat4:
+        """
+        The view matrix for the current camera configuration. Pending input is
+        applied and the matrix rebuilt only if the camera changed since the
+        last read; otherwise the cached matrix is returned as is.
         """
-        Recalculates the camera's position and view matrix based on
-        current yaw, pitch, distance, and target.
+        if self._dirty:
+            self._apply_pending_input()
+            self._view_matrix = self._build_view_matrix()
+            self._dirty = False
+        return self._view_matrix
+
+    def _build_view_matrix(self) -> glm.mat4:
+        """
+        Recalculates the camera's position and local basis based on current
+        yaw, pitch, distance, and target.
+
+        Returns:
+            glm.mat4: The view matrix for the recalculated position and basis.
         """
-        rad_yaw = glm.radians(self.yaw)
-        rad_pitch = glm.radians(self.pitch)
+        # Scalar trig goes through math, glm is only needed for vector ops
+        rad_yaw = self._yaw * _DEG2RAD
+        rad_pitch = self._pitch * _DEG2RAD
+
+        cos_pitch = math.cos(rad_pitch)
+        sin_pitch = math.sin(rad_pitch)
+        cos_yaw = math.cos(rad_yaw)
+        sin_yaw = math.sin(rad_yaw)
 
         # Convert spherical coordinates (yaw, pitch, distance) to Cartesian
-        x = self.distance * glm.cos(rad_pitch) * glm.cos(rad_yaw)
-        y = self.distance * glm.sin(rad_pitch)
-        z = self.distance * glm.cos(rad_pitch) * glm.sin(rad_yaw)
+        x = self._distance * cos_pitch * cos_yaw
+        y = self._distance * sin_pitch
+        z = self._distance * cos_pitch * sin_yaw
+
+        self.position = glm.vec3(x, y, z) + self._target
+
+        # Local coordinate axes, reused by pan until the orientation changes.
+        # The offset above has length `distance`, so forward is already unit
+        # and up_basis is unit because forward and right are orthonormal.
+        self.forward = glm.vec3(-cos_pitch * cos_yaw, -sin_pitch, -cos_pitch * sin_yaw)
+        self.right = glm.normalize(glm.cross(self.forward, self.up))
+        self.up_basis = glm.cross(self.right, self.forward)
 
-        self.position = glm.vec3(x, y, z) + self.target
-        self.view_matrix = glm.lookAt(self.position, self.target, self.up)
+        # Same matrix glm.lookAt builds, filled from the cached basis
+        right, up, forward, eye = self.right, self.up_basis, self.forward, self.position
+        return glm.mat4(
+            glm.vec4(right.x, up.x, -forward.x, 0.0),
+            glm.vec4(right.y, up.y, -forward.y, 0.0),
+            glm.vec4(right.z, up.z, -forward.z, 0.0),
+            glm.vec4(-glm.dot(right, eye), -glm.dot(up, eye), glm.dot(forward, eye), 1.0),
+        )
 
     def get_view_matrix(self) -> glm.mat4:
         """
@@ -74,6 +197,40 @@ class ArcballCamera:
         """
         return self.view_matrix
 
+    def _apply_pending_input(self) -> None:
+        """
+        Applies the mouse, scroll, and pan deltas accumulated since the last
+        rebuild to yaw, pitch, distance, and target, then resets them.
+        """
+        if self._pending_dx or self._pending_dy:
+            self._yaw += self._pending_dx * self.sensitivity
+            self._pitch += self._pending_dy * self.sensitivity
+
+            # Clamp pitch to avoid gimbal lock or flipping
+            self._pitch = glm.clamp(self._pitch, -89.0, 89.0)
+
+            self._pending_dx = 0.0
+            self._pending_dy = 0.0
+
+        if self._pending_scroll:
+            self._distance -= self._pending_scroll * self.zoom_speed
+            self._distance = glm.clamp(self._distance, self.min_distance, self.max_distance)
+            self._pending_scroll = 0.0
+
+        if self._pending_pan.x or self._pending_pan.y:
+            # Pan along the basis of the orientation the deltas apply to
+            self._build_view_matrix()
+
+            # Adjust pan speed based on distance
+            factor = self._distance * 0.001
+
+            # Move the target point (and thus the camera orbit center)
+            self._target += (
+                -self.right * self._pending_pan.x * factor
+                + self.up_basis * self._pending_pan.y * factor
+            )
+            self._pending_pan = glm.vec2(0)
+
     def process_mouse(self, dx: float, dy: float) -> None:
         """
         Updates the yaw and pitch angles based on mouse movement.
@@ -82,13 +239,9 @@ class ArcballCamera:
             dx (float): Horizontal mouse movement in pixels.
             dy (float): Vertical mouse movement in pixels.
         """
-        self.yaw += dx * self.sensitivity
-        self.pitch += dy * self.sensitivity
-
-        # Clamp pitch to avoid gimbal lock or flipping
-        self.pitch = max(-89.0, min(89.0, self.pitch))
-
-        self.update_camera()
+        self._pending_dx += dx
+        self._pending_dy += dy
+        self._dirty = True
 
     def process_scroll(self, scroll_offset: float) -> None:
         """
@@ -98,10 +251,8 @@ class ArcballCamera:
             scroll_offset (float): Mouse scroll delta.
                 Positive values zoom in, negative values zoom out.
         """
-        self.distance -= scroll_offset * self.zoom_speed
-        self.distance = glm.clamp(self.distance, self.min_distance, self.max_distance)
-
-        self.update_camera()
+        self._pending_scroll += scroll_offset
+        self._dirty = True
 
     def pan(self, dx: float, dy: float) -> None:
         """
@@ -111,15 +262,5 @@ class ArcballCamera:
             dx (float): Horizontal mouse movement in pixels.
             dy (float): Vertical mouse movement in pixels.
         """
-        # Compute local coordinate axes
-        direction = glm.normalize(self.target - self.position)
-        right = glm.normalize(glm.cross(direction, self.up))
-        up = glm.normalize(glm.cross(right, direction))
-
-        # Adjust pan speed based on distance
-        factor = self.distance * 0.001
-
-        # Move the target point (and thus the camera orbit center)
-        self.target += -right * dx * factor + up * dy * factor
-
-        self.update_camera()
+        self._pending_pan += glm.vec2(dx, dy)
+        self._dirty = True
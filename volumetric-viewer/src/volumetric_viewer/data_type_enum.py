@@ -17,15 +17,29 @@ class DataType(Enum):
     FLOAT64 = np.float64
     BOOL = np.bool_
 
+    # Filled in once below the class body (annotations only, not members)
+    dtype: np.dtype
+    itemsize: int
+
     @classmethod
     def from_string(cls, name: str):
         """
         Converts a string (case-insensitive) into the corresponding DataType.
         Raises ValueError if the name is invalid.
         """
-        try:
-            return cls[name.upper()]
-        except KeyError as err:
+        data_type = _DATA_TYPE_BY_NAME.get(name.upper())
+        if data_type is None:
             raise ValueError(
-                f"Invalid type '{name}'. Valid types are: {', '.join(cls.list())}"
-            ) from err
\ No newline at end of file
+                f"Invalid type '{name}'. Valid types are: {', '.join(_DATA_TYPE_BY_NAME)}"
+            )
+        return data_type
+
+
+# Build the NumPy dtype objects once instead of at every use site
+for _member in DataType:
+    _member.dtype = np.dtype(_member.value)
+    _member.itemsize = _member.dtype.itemsize
+del _member
+
+# Plain dict lookup, avoids Enum.__getitem__ and the KeyError path on misses
+_DATA_TYPE_BY_NAME: dict[str, DataType] = {member.name: member for member in DataType}
@@ -1,85 +1,100 @@
-from queue import Empty, Queue
+import multiprocessing
+import queue
+from collections import deque
+from dataclasses import dataclass
 
 
 class Event:
-    pass
+    __slots__ = ()
 
+# Events cross between the GUI process and the render loop, so they are frozen
+# and must stay picklable; the dataclass generates the slotted __init__ and __repr__
+
+@dataclass(slots=True, frozen=True)
 class NHDRLoadedEvent(Event):
-    def __init__(self, filepath: str):
-        self.filepath = filepath
+    filepath: str
 
-    def __repr__(self):
-        return f"<NHDRLoadedEvent filepath={self.filepath}>"
-    
+@dataclass(slots=True, frozen=True)
 class RawLoadedEvent(Event):
-    def __init__(self, filepath: str):
-        self.filepath = filepath
-
-    def __repr__(self):
-        return f"<RawLoadedEvent filepath={self.filepath}>"
+    filepath: str
 
+@dataclass(slots=True, frozen=True)
 class ColorChangedEvent(Event):
-    def __init__(self, color: tuple[int, int, int]):
-        self.color = color
-
-    def __repr__(self):
-        return f"<ColorChangedEvent color={self.color}>"
+    color: tuple[int, int, int]
 
+@dataclass(slots=True, frozen=True)
 class MinIsovalueChangedEvent(Event):
-    def __init__(self, isovalue: int):
-        self.isovalue = isovalue
+    isovalue: int
 
-    def __repr__(self):
-        return f"<MinIsovalueChangedEvent isovalue={self.isovalue}>"
-    
+@dataclass(slots=True, frozen=True)
 class MaxIsovalueChangedEvent(Event):
-    def __init__(self, isovalue: int):
-        self.isovalue = isovalue
+    isovalue: int
 
-    def __repr__(self):
-        return f"<MaxIsovalueChangedEvent isovalue={self.isovalue}>"
-    
+@dataclass(slots=True, frozen=True)
 class ViewModeChangedEvent(Event):
-    def __init__(self, view_mode: int):
-        self.view_mode = view_mode
+    view_mode: int
 
-    def __repr__(self):
-        return f"<ViewModeChangedEvent view_mode={self.view_mode}>"
-    
+@dataclass(slots=True, frozen=True)
 class TransferFunctionImportedEvent(Event):
-    def __init__(self, filepath: str, colors: list):
-        self.filepath = filepath
-        self.colors = colors
-
-    def __repr__(self):
-        return f"<TransferFunctionImportedEvent filepath={self.filepath} colors={self.colors}>"
+    filepath: str
+    colors: list
 
+@dataclass(slots=True, frozen=True)
 class TransferFunctionExportedEvent(Event):
-    def __init__(self, filepath: str):
-        self.filepath = filepath
+    filepath: str
 
-    def __repr__(self):
-        return f"<TransferFunctionExportedEvent filepath={self.filepath}>"
-    
+@dataclass(slots=True, frozen=True)
 class TransferFunctionUpdateEvent(Event):
-    def __init__(self, data: dict):
-        self.data = data
+    data: dict
 
-    def __repr__(self):
-        return f"<TransferFunctionUpdatedEvent filepath={self.data}>"    
+@dataclass(slots=True, frozen=True)
+class VolumeLoadFailedEvent(Event):
+    message: str
 
 class EventQueue:
+    # In-process queue, for a GUI running on a thread of the render process.
+    # deque.append/popleft are atomic, so one producer thread (GUI) and one
+    # consumer thread (render loop) can share it without a lock
     def __init__(self):
-        self._queue = Queue()
+        self._queue = deque()
+
+    def push(self, event: Event):
+        self._queue.append(event)
+
+    def pop_all(self):
+        # Drain only what was queued on entry, so a producer that keeps
+        # pushing during the drain cannot stall the consumer's frame
+        pending = self._queue
+        return [pending.popleft() for _ in range(len(pending))]
+
+    def try_pop(self):
+        # Next event or None, without allocating anything when the queue is empty
+        pending = self._queue
+        return pending.popleft() if pending else None
+
+
+class ProcessEventQueue:
+    # Same interface as EventQueue, backed by a multiprocessing queue so the
+    # GUI can run in its own process, free of the render loop's GIL
+    def __init__(self, context=multiprocessing):
+        self._queue = context.Queue()
 
     def push(self, event: Event):
         self._queue.put(event)
 
     def pop_all(self):
         events = []
-        while True:
-            try:
-                events.append(self._queue.get_nowait())
-            except Empty:
-                break
+        while (event := self.try_pop()) is not None:
+            events.append(event)
         return events
+
+    def try_pop(self):
+        # Next event or None, never blocks the caller's frame. empty() polls the
+        # pipe, so the usual empty case ends the drain without raising queue.Empty;
+        # an event still in the producer's feeder thread is picked up next frame
+        if self._queue.empty():
+            return None
+        try:
+            return self._queue.get_nowait()
+        except queue.Empty:
+            return None
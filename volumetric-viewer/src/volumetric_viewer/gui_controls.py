@@ -1,8 +1,9 @@
-from tkinter import Tk, filedialog
+import math
+import os
+from bisect import bisect_left, bisect_right
 
 import numpy as np
 from dearpygui import dearpygui as dpg
-from scipy.interpolate import interp1d
 
 from volumetric_viewer.event_system import (
         ColorChangedEvent,
@@ -14,78 +15,101 @@ from volumetric_viewer.event_system import (
         TransferFunctionImportedEvent,
         TransferFunctionUpdateEvent,
         ViewModeChangedEvent,
+        VolumeLoadFailedEvent,
 )
 
+# Alpha knots as (isovalue, alpha) tuples, always kept sorted by isovalue
 points = []
-first_gradient = [
+
+# Color knots as (N, 4) float32 rows of (isovalue, r, g, b), sorted by isovalue.
+# They are read-only constants; the render process receives its own pickled copy.
+first_gradient = np.array([
                     [0, 1.0, 0.0, 0.0],
                     [80, 0.0, 1.0, 0.0],
                     [255, 0.0, 0.0, 1.0]
-]
-second_gradient = [
+], dtype=np.float32)
+second_gradient = np.array([
                     [0, 1.0, 1.0, 0.0],
                     [100, 0.0, 1.0, 1.0],
                     [255, 0.0, 0.0, 1.0]
-]
-        
-third_gradient = [
+], dtype=np.float32)
+
+third_gradient = np.array([
                     [0, 0.5, 0.0, 1.0],
                     [100, 0.0, 1.0, 1.0],
                     [255, 1.0, 0.0, 1.0]
-]
+], dtype=np.float32)
 
-def interp_knots(knots, x):
-        if not knots:
-            return (0.0, 0.0, 0.0)
-
-        first = knots[0]
-        last = knots[-1]
-
-        x_first = first[0] 
-        x_last = last[0]    
-
-        if x <= x_first:
-            return first[1:]
-        if x >= x_last:
-            return last[1:]
-
-        for i in range(len(knots) - 1):
-            x0 = knots[i][0]  
-            x1 = knots[i+1][0]  
-            if x0 <= x <= x1:
-                t = (x - x0) / (x1 - x0)
-                r0, g0, b0 = knots[i][1:]
-                r1, g1, b1 = knots[i+1][1:]
-                return (
-                    r0 * (1 - t) + r1 * t,
-                    g0 * (1 - t) + g1 * t,
-                    b0 * (1 - t) + b1 * t
-                )
+for gradient in (first_gradient, second_gradient, third_gradient):
+    gradient.flags.writeable = False
 
+# Number of samples shown in each gradient preview
+GRADIENT_SAMPLES = 255
+
+# Event pushed for each supported volume file extension
+_VOLUME_EVENT_BY_EXTENSION = {
+    ".nhdr": NHDRLoadedEvent,
+    ".raw": RawLoadedEvent,
+}
+
+# Linearly interpolates the knot colors at x (a scalar or an array of positions)
+def interp_knots(knots, x):
+    if len(knots) == 0:
         return (0.0, 0.0, 0.0)
 
+    # No copy for the gradient arrays, which are already float32
+    knots = np.asarray(knots, dtype=np.float32)
+    xp = knots[:, 0]
+    return (
+        np.interp(x, xp, knots[:, 1]),
+        np.interp(x, xp, knots[:, 2]),
+        np.interp(x, xp, knots[:, 3])
+    )
+
+# Builds the (GRADIENT_SAMPLES, 4) RGBA ramp for the knots in a single pass
 def generate_gradient(colors_list):
-    gradient_data = []
-    for i in range(255):
-        r, g, b = interp_knots(colors_list, i)
-        gradient_data.append([r, g, b, 1.0])
+    gradient_data = np.ones((GRADIENT_SAMPLES, 4), dtype=np.float32)
+    gradient_data[:, 0], gradient_data[:, 1], gradient_data[:, 2] = interp_knots(
+        colors_list, np.arange(GRADIENT_SAMPLES)
+    )
     return gradient_data
 
+# Ramp and texture per gradient, keyed by id() of the knot array, so each
+# gradient is interpolated and uploaded only once. The array itself is kept
+# in the entry so a reused id is never mistaken for a hit.
+_gradient_cache = {}
+
+def _gradient_texture(colors):
+    cached = _gradient_cache.get(id(colors))
+    if cached is None or cached[0] is not colors:
+        gradient_data = generate_gradient(colors)
+        with dpg.texture_registry():
+            texture = dpg.add_raw_texture(
+                GRADIENT_SAMPLES,
+                1,
+                gradient_data.ravel(),
+                format=dpg.mvFormat_Float_rgba
+            )
+        cached = (colors, gradient_data, texture)
+        _gradient_cache[id(colors)] = cached
+    return cached[2]
+
+# Drops the cached ramp and texture of a gradient whose knots were edited
+def invalidate_gradient(colors):
+    cached = _gradient_cache.pop(id(colors), None)
+    if cached is not None and cached[0] is colors:
+        dpg.delete_item(cached[2])
+
 def display_gradient(colors):
-    gradient_data = generate_gradient(colors)
+    # Draw the whole ramp as a single texture instead of issuing
+    # one draw_rectangle per sample
+    texture = _gradient_texture(colors)
 
     width = 500
     height = 20
 
     with dpg.drawlist(width=width, height=height) as drawlist:
-        for i, (r, g, b, a) in enumerate(gradient_data):
-            dpg.draw_rectangle(
-                (i, 0),
-                (i + 1, height),
-                color=(int(r * 255), int(g * 255), int(b * 255), 255),
-                fill=True,
-                parent=drawlist
-            )
+        dpg.draw_image(texture, (0, 0), (GRADIENT_SAMPLES, height), parent=drawlist)
 
 # Function to show an error popup
 def show_error_popup(message):
@@ -95,38 +119,43 @@ def show_error_popup(message):
         no_close=False,
         width=300,
         height=150
-    ):
+    ) as popup:
         dpg.add_text(message)
         dpg.add_spacer(height=10)
-        dpg.add_button(label="OK", width=75, callback=lambda: dpg.delete_item(dpg.last_container()))
+        dpg.add_button(label="OK", width=75, callback=lambda: dpg.delete_item(popup))
 
 # Function to open a file dialog for file selection
 def open_file_dialog(sender, app_data, user_data):
-    root = Tk()
-    root.withdraw()
+    dpg.show_item("volume_file_dialog")
 
-    # Open file dialog to select NHDR or Raw file
-    file_path = filedialog.askopenfilename(
-        title="Select an NHDR or a Raw file",
-        filetypes=[(["NHDR Files", "Raw Files"], ["*.nhdr", ".raw"])]
-    )
+# Returns the file picked in a dearpygui file dialog, or None if nothing was picked
+def selected_file(app_data):
+    selections = app_data.get("selections") or {}
+    return next(iter(selections.values()), None)
 
-    root.destroy()
+# Callback of the volume file dialog, loads the picked NHDR or Raw file
+def on_volume_file_selected(sender, app_data, user_data):
+    file_path = selected_file(app_data)
+    if not file_path:
+        return
 
-    if file_path and file_path.endswith(".nhdr"):
-        dpg.set_value("loaded_file_path", file_path)
-        if "event_queue" in user_data:
-            user_data["event_queue"].push(NHDRLoadedEvent(file_path))
-    elif file_path and file_path.endswith(".raw"):
-        dpg.set_value("loaded_file_path", file_path)
-        if "event_queue" in user_data:
-            user_data["event_queue"].push(RawLoadedEvent(file_path))
-    elif file_path:
+    event_type = _VOLUME_EVENT_BY_EXTENSION.get(os.path.splitext(file_path)[1])
+    if event_type is None:
         show_error_popup("Invalid file selected.")
+        return
+
+    dpg.set_value("loaded_file_path", file_path)
+    if "event_queue" in user_data:
+        user_data["event_queue"].push(event_type(file_path))
 
 # Event handler for color change
 def on_color_changed(sender, app_data, user_data):
-    color = tuple(c for c in app_data[:3])
+    color = tuple(app_data[:3])
+    # Skip re-sending the same color while the picker is held still
+    if user_data.get("last_color") == color:
+        return
+    user_data["last_color"] = color
+
     event_queue = user_data.get("event_queue")
     if event_queue:
         event_queue.push(ColorChangedEvent(color))
@@ -140,6 +169,11 @@ def on_min_isovalue_changed(sender, app_data, user_data):
         min_val = max_val
         dpg.set_value("min_isovalue_slider", min_val)
 
+    # Skip re-sending the same isovalue while the slider is held still
+    if user_data.get("last_min_isovalue") == min_val:
+        return
+    user_data["last_min_isovalue"] = min_val
+
     event_queue = user_data.get("event_queue")
     if event_queue:
         event_queue.push(MinIsovalueChangedEvent(min_val))
@@ -153,22 +187,21 @@ def on_max_isovalue_changed(sender, app_data, user_data):
         max_val = min_val
         dpg.set_value("max_isovalue_slider", max_val)
 
+    if user_data.get("last_max_isovalue") == max_val:
+        return
+    user_data["last_max_isovalue"] = max_val
+
     event_queue = user_data.get("event_queue")
     if event_queue:
         event_queue.push(MaxIsovalueChangedEvent(max_val))
 
 # Function to import a transfer function (TF) file
 def import_tf_file(sender, app_data, user_data):
-    root = Tk()
-    root.withdraw()
+    dpg.show_item("import_tf_file_dialog")
 
-    # Open file dialog to select TF file
-    file_path = filedialog.askopenfilename(
-        title="Select a transfer function file",
-        filetypes=[("Transfer Function Files", "*.tfl")]
-    )
-
-    root.destroy()
+# Callback of the import dialog, loads the picked TF file with the current gradient
+def on_tf_file_imported(sender, app_data, user_data):
+    file_path = selected_file(app_data)
 
     colors = get_gradient_colors(dpg.get_value("gradient_radio"))
 
@@ -178,22 +211,51 @@ def import_tf_file(sender, app_data, user_data):
 
 # Function to export a transfer function (TF) file
 def export_tf_file(sender, app_data, user_data):
-    root = Tk()
-    root.withdraw()
-
-    # Save file dialog to export TF file
-    file_path = filedialog.asksaveasfilename(
-        title="Export Transfer Function As...",
-        defaultextension=".tfl",
-        filetypes=[("Transfer Function Files", "*.tfl")],
-        initialfile="transfer_function.tfl"
-    )
+    dpg.show_item("export_tf_file_dialog")
 
-    root.destroy()
+# Callback of the export dialog, saves the TF to the chosen path
+def on_tf_file_exported(sender, app_data, user_data):
+    file_path = app_data.get("file_path_name")
 
     if file_path:
         user_data["event_queue"].push(TransferFunctionExportedEvent(file_path))
 
+# Function to create the hidden dearpygui file dialogs shown by the buttons
+def file_dialogs(event_queue):
+    with dpg.file_dialog(
+        tag="volume_file_dialog",
+        label="Select an NHDR or a Raw file",
+        show=False,
+        width=500,
+        height=400,
+        callback=on_volume_file_selected,
+        user_data={"event_queue": event_queue}
+    ):
+        dpg.add_file_extension("Volume Files (*.nhdr *.raw){.nhdr,.raw}")
+
+    with dpg.file_dialog(
+        tag="import_tf_file_dialog",
+        label="Select a transfer function file",
+        show=False,
+        width=500,
+        height=400,
+        callback=on_tf_file_imported,
+        user_data={"event_queue": event_queue}
+    ):
+        dpg.add_file_extension(".tfl")
+
+    with dpg.file_dialog(
+        tag="export_tf_file_dialog",
+        label="Export Transfer Function As...",
+        default_filename="transfer_function",
+        show=False,
+        width=500,
+        height=400,
+        callback=on_tf_file_exported,
+        user_data={"event_queue": event_queue}
+    ):
+        dpg.add_file_extension(".tfl")
+
 # Function to set up the default view settings
 def default_view_settings(event_queue):
     with dpg.group(tag="default_view_settings_group", indent=40):
@@ -233,6 +295,10 @@ def default_view_settings(event_queue):
             user_data={"event_queue": event_queue}
         )
 
+# Fixed sample positions of the interpolation line, built once
+_X_DENSE = np.linspace(0, 255, 512)
+_X_DENSE_LIST = _X_DENSE.tolist()
+
 # Function to update the transfer function plot with points and interpolation
 def update_transfer_plot(from_outside = False, event_queue=None):
     if not points:
@@ -240,17 +306,15 @@ def update_transfer_plot(from_outside = False, event_queue=None):
         dpg.set_value("line_series", [[], []])
         return 
 
-    sorted_pts = sorted(points, key=lambda p: p[0])
-    xs, ys = zip(*sorted_pts)
-
-    dpg.set_value("scatter_series", [list(xs), list(ys)])
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
 
-    f_interp = interp1d(xs, ys, kind='linear', bounds_error=False, fill_value=(ys[0], ys[-1]))
+    dpg.set_value("scatter_series", [xs, ys])
 
-    x_dense = np.linspace(0, 255, 512)
-    y_dense = f_interp(x_dense)
+    # np.interp clamps to the first/last alpha outside the knot range
+    y_dense = np.interp(_X_DENSE, xs, ys)
 
-    dpg.set_value("line_series", [list(x_dense), list(y_dense)])
+    dpg.set_value("line_series", [_X_DENSE_LIST, y_dense.tolist()])
 
 
 # Function to convert mouse position to plot coordinates, excluding the axes area
@@ -282,6 +346,16 @@ def mouse_pos_to_plot_coords():
     return pos 
 
 
+# Index of the first point within (tolerance_x, tolerance_y) of (x, y), or -1.
+# Points are sorted by isovalue, so only the ones inside the x window are checked.
+def find_point(x, y, tolerance_x, tolerance_y):
+    start = bisect_right(points, (x - tolerance_x, math.inf))
+    end = bisect_left(points, (x + tolerance_x, -math.inf))
+    for i in range(start, end):
+        if abs(points[i][1] - y) < tolerance_y:
+            return i
+    return -1
+
 # Function for left-click interaction (add points)
 def on_left_click(x, y, event_queue):
     if not (0 <= x <= 255 and 0 <= y <= 1.0):
@@ -291,32 +365,28 @@ def on_left_click(x, y, event_queue):
 
     x = int(x)
 
-    for _, (px, py) in enumerate(points):
-        if abs(px - x) < tolerance_x and abs(py - y) < tolerance_y:
-            return 
-    points.append((x, y))
-    dpg.set_value("selected_point", len(points) - 1) 
+    if find_point(x, y, tolerance_x, tolerance_y) != -1:
+        return
+
+    index = bisect_left(points, (x, y))
+    points.insert(index, (x, y))
+    dpg.set_value("selected_point", index)
     update_transfer_plot()
-    data = {}
-    data["alpha_knots"] = points
-    data["color_knots"] = get_gradient_colors(dpg.get_value("gradient_radio"))
-    event_queue.push(TransferFunctionUpdateEvent(data))
+    push_transfer_function_update(event_queue, dpg.get_value("gradient_radio"))
 
 # Function for right-click interaction (remove points)
 def on_right_click(x, y, event_queue):
     tolerance_y = 0.02
     tolerance_x = 0.8
 
-    for i, (px, py) in enumerate(points):
-        if abs(px - x) < tolerance_x and abs(py - y) < tolerance_y:
-            points.pop(i) 
-            dpg.set_value("selected_point", -1)
-            update_transfer_plot() 
-            data = {}
-            data["alpha_knots"] = points
-            data["color_knots"] = get_gradient_colors(dpg.get_value("gradient_radio"))
-            event_queue.push(TransferFunctionUpdateEvent(data))
-            return
+    index = find_point(x, y, tolerance_x, tolerance_y)
+    if index == -1:
+        return
+
+    points.pop(index)
+    dpg.set_value("selected_point", -1)
+    update_transfer_plot()
+    push_transfer_function_update(event_queue, dpg.get_value("gradient_radio"))
 
 # Mouse click callback to handle different mouse buttons
 def mouse_click_callback(sender, app_data, user_data):
@@ -343,10 +413,7 @@ def clear_points(sender, app_data, user_data):
     points.clear()
     dpg.set_value("selected_point", -1)
     update_transfer_plot()
-    data = {}
-    data["alpha_knots"] = points
-    data["color_knots"] = get_gradient_colors(dpg.get_value("gradient_radio"))
-    user_data["event_queue"].push(TransferFunctionUpdateEvent(data)) 
+    push_transfer_function_update(user_data["event_queue"], dpg.get_value("gradient_radio"))
 
 
 # Function to create the transfer function editor (plot and controls)
@@ -370,14 +437,18 @@ def transfer_function_editor(event_queue):
     update_transfer_plot()
 
 def on_gradient_changed(sender, app_data, user_data):
-    data = {}
-    global first_gradient, second_gradient, third_gradient
-    data["alpha_knots"] = points
-    data["color_knots"] = get_gradient_colors(app_data)
-
     event_queue = user_data.get("event_queue")
     if event_queue:
-        event_queue.push(TransferFunctionUpdateEvent(data))
+        push_transfer_function_update(event_queue, app_data)
+
+# Sends the current knots to the render process. The alpha knots go as a snapshot,
+# the queue pickles events on a feeder thread after push returns, while points
+# may already have been edited again.
+def push_transfer_function_update(event_queue, select_gradient):
+    event_queue.push(TransferFunctionUpdateEvent({
+        "alpha_knots": list(points),
+        "color_knots": get_gradient_colors(select_gradient),
+    }))
 
 def get_gradient_colors(select_gradient):
     global first_gradient, second_gradient, third_gradient
@@ -424,26 +495,30 @@ def tf_view_settings(event_queue):
 def toggle_view_mode(sender, app_data, user_data):
     view_mode = 0
     if app_data == "Default View":
-        dpg.configure_item("default_view_group", show=True)
-        dpg.configure_item("tf_view_group", show=False)
+        dpg.configure_item(user_data["default_view_group"], show=True)
+        dpg.configure_item(user_data["tf_view_group"], show=False)
     elif app_data == "Transfer Function View":
-        dpg.configure_item("default_view_group", show=False)
-        dpg.configure_item("tf_view_group", show=True)
+        dpg.configure_item(user_data["default_view_group"], show=False)
+        dpg.configure_item(user_data["tf_view_group"], show=True)
         view_mode = 1
 
+    if user_data.get("last_view_mode") == view_mode:
+        return
+    user_data["last_view_mode"] = view_mode
+
     event_queue = user_data.get("event_queue")
     if event_queue:
         event_queue.push(ViewModeChangedEvent(view_mode))
 
 def on_transfer_function_updated(sender, app_data):
-    event_data = app_data
+    alpha_knots = app_data.get("alpha_knots", [])
 
-    alpha_knots = event_data.get("alpha_knots", [])
+    # The knots arrive as (isovalue, alpha) tuples already sorted by isovalue,
+    # so they are copied in place and the sort only settles equal isovalues
+    points[:] = alpha_knots
+    points.sort()
 
-    global points
-    points = [(x, y) for x, y in alpha_knots]
-
-    update_transfer_plot()
+    update_transfer_plot(from_outside=True)
 
 # Main function to set up and run the GUI
 def run_gui(position=(100, 100), event_queue=None, gui_event_queue=None):
@@ -463,6 +538,8 @@ def run_gui(position=(100, 100), event_queue=None, gui_event_queue=None):
             dpg.add_theme_color(dpg.mvThemeCol_ButtonHovered, (0, 200, 255, 255))
             dpg.add_theme_color(dpg.mvThemeCol_ButtonActive, (0, 100, 200, 255))
 
+    file_dialogs(event_queue)
+
     with dpg.window(label="", pos=(0, 0),
                     width=viewport_width, height=viewport_height,
                     no_title_bar=True, no_move=True, no_resize=True, no_collapse=True):
@@ -482,6 +559,10 @@ def run_gui(position=(100, 100), event_queue=None, gui_event_queue=None):
         dpg.add_spacer(height=20)
         dpg.add_separator(label="View Options")
 
+        # Filled with the integer ids of the view groups once they exist,
+        # so toggling views skips the string alias lookup
+        view_mode_data = {"event_queue": event_queue}
+
         with dpg.group(tag="view_mode_group", indent=20):
             dpg.add_text("Select View Mode:")
             dpg.add_radio_button(
@@ -489,28 +570,31 @@ def run_gui(position=(100, 100), event_queue=None, gui_event_queue=None):
                 items=["Default View", "Transfer Function View"],
                 default_value=0,
                 callback=toggle_view_mode, 
-                user_data={"event_queue": event_queue},
+                user_data=view_mode_data,
                 horizontal=True
             )
 
-        with dpg.group(tag="default_view_group"):
+        with dpg.group() as default_view_group:
             default_view_settings(event_queue)
 
-        with dpg.group(tag="tf_view_group"):
+        with dpg.group() as tf_view_group:
             tf_view_settings(event_queue)
 
-    dpg.configure_item("default_view_group", show=True)
-    dpg.configure_item("tf_view_group", show=False)
+        view_mode_data["default_view_group"] = default_view_group
+        view_mode_data["tf_view_group"] = tf_view_group
+
+    dpg.configure_item(default_view_group, show=True)
+    dpg.configure_item(tf_view_group, show=False)
 
     dpg.setup_dearpygui()
     dpg.show_viewport()
 
     while dpg.is_dearpygui_running():
-        for event in gui_event_queue.pop_all():
+        while (event := gui_event_queue.try_pop()) is not None:
             if isinstance(event, TransferFunctionUpdateEvent):
                 on_transfer_function_updated(None, event.data)
-                
-                pass
+            elif isinstance(event, VolumeLoadFailedEvent):
+                show_error_popup(event.message)
         dpg.render_dearpygui_frame()
     dpg.destroy_context()
     
@@ -1,12 +1,15 @@
-import threading
+import multiprocessing
 
 import glfw
 import numpy as np
 from OpenGL.GL import (
     GL_BLEND,
+    GL_COLOR_BUFFER_BIT,
+    GL_DEPTH_BUFFER_BIT,
     GL_ONE_MINUS_SRC_ALPHA,
     GL_SRC_ALPHA,
     glBlendFunc,
+    glClear,
     glClearColor,
     glEnable,
     glViewport,
@@ -16,15 +19,16 @@ from pyglm import glm
 from volumetric_viewer.arcball_camera import ArcballCamera
 from volumetric_viewer.event_system import (
     ColorChangedEvent,
-    EventQueue,
     MaxIsovalueChangedEvent,
     MinIsovalueChangedEvent,
     NHDRLoadedEvent,
+    ProcessEventQueue,
     RawLoadedEvent,
     TransferFunctionExportedEvent,
     TransferFunctionImportedEvent,
     TransferFunctionUpdateEvent,
     ViewModeChangedEvent,
+    VolumeLoadFailedEvent,
 )
 from volumetric_viewer.gui_controls import run_gui
 from volumetric_viewer.nhdr_reader import NHDRReader
@@ -32,12 +36,18 @@ from volumetric_viewer.raw_reader import RawReader
 from volumetric_viewer.renderer import Renderer
 from volumetric_viewer.shader_program import ShaderProgram
 from volumetric_viewer.transfer_function_manager import TransferFunctionManager
-from volumetric_viewer.volume import Volume
+from volumetric_viewer.volume_loader import VolumeLoader
 
 WINDOW_WIDTH = 800
 WINDOW_HEIGHT = 600
 ASPECT_RATIO = WINDOW_WIDTH / WINDOW_HEIGHT
 
+# Reader of the file format each load event is sent for
+VOLUME_READERS = {
+    NHDRLoadedEvent: NHDRReader,
+    RawLoadedEvent: RawReader,
+}
+
 def main():
     if not glfw.init():
         raise RuntimeError("Failed to initialize GLFW")
@@ -58,9 +68,13 @@ def main():
 
     gui_x = x_pos + width
     gui_y = y_pos
-    event_queue = EventQueue()
-    gui_event_queue = EventQueue()
-    threading.Thread(target=(run_gui), args=((gui_x, gui_y), event_queue, gui_event_queue), daemon=True).start()
+    # The GUI runs in its own process; spawn keeps it from inheriting the GL context
+    context = multiprocessing.get_context("spawn")
+    event_queue = ProcessEventQueue(context)
+    gui_event_queue = ProcessEventQueue(context)
+    context.Process(
+        target=run_gui, args=((gui_x, gui_y), event_queue, gui_event_queue), daemon=True
+    ).start()
 
     camera = ArcballCamera(
         target=glm.vec3(0.5, 0.5, 0.5),
@@ -120,49 +134,54 @@ def main():
     transfer_function_manager = TransferFunctionManager()
     shader = ShaderProgram("src/shaders/vertex.glsl", "src/shaders/fragment.glsl")
     renderer = Renderer(shader.program_id)
-    volume = None
     view_mode = 0
-    isovalue_min = 0
-    isovalue_max = 255
+    # Isovalue limits are kept normalized to [0, 1], as the shader expects them
+    min_isovalue_limit = 0.0
+    max_isovalue_limit = 1.0
     color = (1, 100/255.0, 100/255.0)
 
     glViewport(0, 0, WINDOW_WIDTH, WINDOW_HEIGHT)
 
-    current_volume_loaded = None
+    # Model and projection never change, so they are uploaded once;
+    # uniform values persist in the program between frames
+    model = glm.mat4(1.0)
+    model_inv = glm.inverse(model)
+    projection = glm.perspective(glm.radians(45.0), ASPECT_RATIO, 0.1, 100.0)
+
+    shader.use()
+    shader.set_uniform_mat4("model", np.array(model.to_list(), dtype=np.float32))
+    shader.set_uniform_mat4("projection", np.array(projection.to_list(), dtype=np.float32))
+    shader.set_uniform1i("transferFuncTex", 1)
+    last_view = None
+
+    # Uniforms set every frame are resolved once, the setters then skip the lookup by name
+    view_uniform = shader.resolve("view")
+    camera_pos_uniform = shader.resolve("cameraPos")
+    volume_scale_uniform = shader.resolve("volumeScale")
+    view_mode_uniform = shader.resolve("viewMode")
+    volume_color_uniform = shader.resolve("volumeColor")
+    min_isovalue_uniform = shader.resolve("minIsovalueLimit")
+    max_isovalue_uniform = shader.resolve("maxIsovalueLimit")
+
+    # A file that fails to load is reported in the GUI instead of stopping the render loop
+    def on_load_error(filepath, error):
+        print(f"Failed to load {filepath}: {error}")
+        gui_event_queue.push(VolumeLoadFailedEvent(f"Failed to load {filepath}:\n{error}"))
+
+    loader = VolumeLoader(on_load_error)
 
     while not glfw.window_should_close(window):
         glfw.poll_events()
 
-        for event in event_queue.pop_all():
-            if isinstance(event, NHDRLoadedEvent):
-                if current_volume_loaded != event.filepath:
-                    current_volume_loaded = event.filepath       
-                    reader = NHDRReader(current_volume_loaded)
-                    volume = Volume(
-                        reader.data,
-                        (reader.dim_x, reader.dim_y, reader.dim_z),
-                        (reader.spacing_x, reader.spacing_y, reader.spacing_z)
-                    )
-                    renderer.update_volume(volume)
-                    volume.upload_to_gpu()
-            elif isinstance(event, RawLoadedEvent):
-                if current_volume_loaded != event.filepath:
-                    current_volume_loaded = event.filepath       
-                    reader = RawReader(current_volume_loaded)
-                    volume = Volume(
-                        reader.data,
-                        (reader.dim_x, reader.dim_y, reader.dim_z),
-                        (reader.spacing_x, reader.spacing_y, reader.spacing_z)
-                    )
-                    renderer.update_volume(volume)
-                    volume.upload_to_gpu()
-                print(event)
+        while (event := event_queue.try_pop()) is not None:
+            if isinstance(event, (NHDRLoadedEvent, RawLoadedEvent)):
+                loader.load(VOLUME_READERS[type(event)], event.filepath)
             elif isinstance(event, ColorChangedEvent):
                 color = event.color
             elif isinstance(event, MinIsovalueChangedEvent):
-                isovalue_min = event.isovalue
+                min_isovalue_limit = event.isovalue/255.0
             elif isinstance(event, MaxIsovalueChangedEvent):
-                isovalue_max = event.isovalue
+                max_isovalue_limit = event.isovalue/255.0
             elif isinstance(event, ViewModeChangedEvent):
                 view_mode = event.view_mode
             elif isinstance(event, TransferFunctionImportedEvent):
@@ -174,48 +193,44 @@ def main():
             elif isinstance(event, TransferFunctionUpdateEvent):
                 transfer_function_manager.update_transfer_function(event.data)
 
-        from OpenGL.GL import GL_COLOR_BUFFER_BIT, GL_DEPTH_BUFFER_BIT, glClear
+        # The texture upload needs the GL context, so it happens here once loaded
+        if (volume := loader.poll()) is not None:
+            renderer.update_volume(volume)
+            volume.upload_to_gpu()
+
+        renderer.swap_pending_volume()
+
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
 
         shader.use()
 
-        model = glm.mat4(1.0)
-        projection = glm.perspective(glm.radians(45.0), WINDOW_WIDTH / WINDOW_HEIGHT, 0.1, 100.0)
+        # The camera returns the same matrix object until it moves
         view = camera.get_view_matrix()
+        if view is not last_view:
+            last_view = view
+            shader.set_uniform_mat4_loc(view_uniform, np.array(view.to_list(), dtype=np.float32))
 
-        shader.set_uniform_mat4("model", np.array(model.to_list(), dtype=np.float32))
-        shader.set_uniform_mat4("projection", np.array(projection.to_list(), dtype=np.float32))
-        shader.set_uniform_mat4("view", np.array(view.to_list(), dtype=np.float32))
-
-        model_inv = glm.inverse(model)
-        cam_pos_world = glm.vec4(camera.position.x, camera.position.y, camera.position.z, 1.0)
-        cam_pos_model = model_inv * cam_pos_world
-        shader.set_uniform_vec3("cameraPos", [cam_pos_model.x, cam_pos_model.y, cam_pos_model.z])
-
-        shader.set_uniform_vec3("volumeScale", [
-            renderer.scale_factors[0],
-            renderer.scale_factors[1],
-            renderer.scale_factors[2]
-        ])
+            cam_pos_model = glm.vec3(model_inv * glm.vec4(camera.position, 1.0))
+            shader.set_uniform_vec3_loc(camera_pos_uniform, cam_pos_model)
 
-        shader.set_uniform1i("viewMode", view_mode)
+        # ShaderProgram only sends the uniforms whose value changed
+        shader.set_uniform_vec3_loc(volume_scale_uniform, renderer.scale_factors)
+        shader.set_uniform1i_loc(view_mode_uniform, view_mode)
 
         if view_mode == 0:
-            shader.set_uniform_vec3("volumeColor", [color[0], color[1], color[2]])
-            min_normalized_isovalue = isovalue_min/255.0
-            max_normalized_isovalue = isovalue_max/255.0
-            shader.set_uniform1f("minIsovalueLimit", min_normalized_isovalue)
-            shader.set_uniform1f("maxIsovalueLimit", max_normalized_isovalue)
+            shader.set_uniform_vec3_loc(volume_color_uniform, color)
+            shader.set_uniform1f_loc(min_isovalue_uniform, min_isovalue_limit)
+            shader.set_uniform1f_loc(max_isovalue_uniform, max_isovalue_limit)
 
         else:
+            # A no-op unless an upload changed the binding since the last frame
             transfer_function_manager.bind_transfer_function(1)
-            shader.set_uniform1i("transferFuncTex", 1)
 
         renderer.render()
         glfw.swap_buffers(window)
 
-    if volume:
-        volume.delete()
+    loader.shutdown()
+    renderer.delete()
     shader.delete()
     glfw.terminate()
 
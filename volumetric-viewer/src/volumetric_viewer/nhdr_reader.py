@@ -1,12 +1,15 @@
 import os
+import re
 from typing import Any
 
-import nrrd
 import numpy as np
 
 from volumetric_viewer.data_type_enum import DataType
 from volumetric_viewer.raw_parser import RawParser
 
+# Contents of each parenthesized vector, e.g. ``(1,0,0) (0,1,0) (0,0,1)``
+_VECTOR_RE = re.compile(r"\(([^)]*)\)")
+
 
 class NHDRReader:
     """
@@ -15,6 +18,7 @@ class NHDRReader:
 
     This class parses both the `.nhdr` header and the corresponding `.raw` data file,
     using :class:`~volumetric_renderer.raw_parser.RawParser` to load the binary data.
+    Only the header is read on construction; the data is loaded on first access to :attr:`data`.
 
     It supports validation of volume dimensions, voxel spacing, and data types.
 
@@ -45,22 +49,18 @@ class NHDRReader:
         self._data_file: str
 
         self._dimension: int
-        self._spacing_x: float
-        self._spacing_y: float
-        self._spacing_z: float
-
-        self._dim_x: int
-        self._dim_y: int
-        self._dim_z: int
+        self._spacing: tuple[float, float, float]
+        self._shape: tuple[int, int, int]
 
         self._d_type: DataType
-        self._data: np.ndarray
+        self._endian: str
+        self._data: np.ndarray | None = None
 
         self._load_nhdr()
 
     def _load_nhdr(self) -> None:
         """
-        Load the NHDR file, parse its metadata fields, and read the associated RAW data.
+        Load the NHDR header, parse its metadata fields, and check the associated RAW file exists.
 
         :raises FileNotFoundError: If the NHDR file or the referenced RAW file does not exist.
         :raises ValueError: If any required metadata field is missing or malformed.
@@ -68,18 +68,46 @@ class NHDRReader:
         if not os.path.exists(self._nhdr_file_path):
             raise FileNotFoundError(f"NHDR file not found: {self._nhdr_file_path}")
 
-        _, header = nrrd.read(self._nhdr_file_path)
+        header = self._read_header()
 
         self._parse_dimension(header)
         self._parse_data_file(header)
         self._parse_spacing(header)
         self._parse_sizes(header)
         self._parse_data_type(header)
+        self._parse_endian(header)
 
         if not os.path.exists(self._data_file):
             raise FileNotFoundError(f"Raw data file not found: {self._data_file}")
 
-        self._data = RawParser(self._data_file).read_data()
+    def _read_header(self) -> dict[str, str]:
+        """
+        Read the NHDR header fields as raw strings.
+
+        Fields are ``key: value`` lines after the ``NRRD000X`` magic line.
+        Comments and ``key:=value`` pairs are skipped, and a blank line ends the header.
+
+        :returns: Header fields keyed by field name.
+        :rtype: dict[str, str]
+        :raises ValueError: If the file does not start with the NRRD magic line.
+        """
+        with open(self._nhdr_file_path, encoding="ascii") as file:
+            magic = file.readline()
+            if not magic.startswith("NRRD"):
+                raise ValueError(f"Not an NRRD header: {self._nhdr_file_path}")
+
+            header = {}
+            for line in file:
+                line = line.rstrip("\r\n")
+                if not line:
+                    break
+                if line.startswith("#") or ":=" in line:
+                    continue
+                field, separator, value = line.partition(": ")
+                if separator:
+                    header[field.strip()] = value.strip()
+
+        return header
 
     def _parse_dimension(self, header: dict[str, Any]) -> None:
         """
@@ -119,13 +147,18 @@ class NHDRReader:
         :type header: dict[str, Any]
         :raises ValueError: If the ``space directions`` field is missing or malformed.
         """
-        space_directions = header.get("space directions")
-        if space_directions is None or len(space_directions) != 3:
+        space_directions = [
+            direction.split(",")
+            for direction in _VECTOR_RE.findall(header.get("space directions", ""))
+        ]
+        if len(space_directions) != 3 or any(len(d) != 3 for d in space_directions):
             raise ValueError("Invalid or missing 'space directions' in NHDR header")
 
-        self._spacing_x = float(space_directions[0][0])
-        self._spacing_y = float(space_directions[1][1])
-        self._spacing_z = float(space_directions[2][2])
+        self._spacing = (
+            float(space_directions[0][0]),
+            float(space_directions[1][1]),
+            float(space_directions[2][2])
+        )
 
     def _parse_sizes(self, header: dict[str, Any]) -> None:
         """
@@ -135,13 +168,11 @@ class NHDRReader:
         :type header: dict[str, Any]
         :raises ValueError: If the ``sizes`` field is missing or malformed.
         """
-        sizes = header.get("sizes")
-        if sizes is None or len(sizes) != 3:
+        sizes = header.get("sizes", "").split()
+        if len(sizes) != 3:
             raise ValueError("Invalid or missing 'sizes' in NHDR header")
 
-        self._dim_x = int(sizes[0])
-        self._dim_y = int(sizes[1])
-        self._dim_z = int(sizes[2])
+        self._shape = (int(sizes[0]), int(sizes[1]), int(sizes[2]))
 
     def _parse_data_type(self, header: dict[str, Any]) -> None:
         """
@@ -157,6 +188,18 @@ class NHDRReader:
 
         self._d_type = DataType.from_string(type_str)
 
+    def _parse_endian(self, header: dict[str, Any]) -> None:
+        """
+        Parse the ``endian`` field, which NRRD defaults to little-endian when omitted.
+
+        :param header: Parsed NHDR header dictionary.
+        :type header: dict[str, Any]
+        :raises ValueError: If the ``endian`` field is neither ``little`` nor ``big``.
+        """
+        self._endian = header.get("endian", "little")
+        if self._endian not in ("little", "big"):
+            raise ValueError(f"Unsupported endian in NHDR header: {self._endian}")
+
     # ======================
     #   Public Properties
     # ======================
@@ -179,7 +222,7 @@ class NHDRReader:
         :returns: Spacing value along X.
         :rtype: float
         """
-        return self._spacing_x
+        return self._spacing[0]
 
     @property
     def spacing_y(self) -> float:
@@ -189,7 +232,7 @@ class NHDRReader:
         :returns: Spacing value along Y.
         :rtype: float
         """
-        return self._spacing_y
+        return self._spacing[1]
 
     @property
     def spacing_z(self) -> float:
@@ -199,7 +242,7 @@ class NHDRReader:
         :returns: Spacing value along Z.
         :rtype: float
         """
-        return self._spacing_z
+        return self._spacing[2]
 
     @property
     def dim_x(self) -> int:
@@ -209,7 +252,7 @@ class NHDRReader:
         :returns: Number of voxels along X.
         :rtype: int
         """
-        return self._dim_x
+        return self._shape[0]
 
     @property
     def dim_y(self) -> int:
@@ -219,7 +262,7 @@ class NHDRReader:
         :returns: Number of voxels along Y.
         :rtype: int
         """
-        return self._dim_y
+        return self._shape[1]
 
     @property
     def dim_z(self) -> int:
@@ -229,7 +272,7 @@ class NHDRReader:
         :returns: Number of voxels along Z.
         :rtype: int
         """
-        return self._dim_z
+        return self._shape[2]
 
     @property
     def d_type(self) -> DataType:
@@ -241,14 +284,27 @@ class NHDRReader:
         """
         return self._d_type
 
+    @property
+    def endian(self) -> str:
+        """
+        Byte order of the values in the associated RAW file, ``"little"`` or ``"big"``.
+
+        :returns: Byte order of the volume data.
+        :rtype: str
+        """
+        return self._endian
+
     @property
     def data(self) -> np.ndarray:
         """
-        The volumetric data loaded from the associated RAW file.
+        The volumetric data loaded from the associated RAW file, read on first access.
 
+        :raises ValueError: If the RAW file size does not match the header's sizes.
         :returns: Loaded volume data.
         :rtype: numpy.ndarray
         """
+        if self._data is None:
+            self._data = RawParser(self._data_file, self._endian).read_data()
         return self._data
 
     @property
@@ -269,7 +325,7 @@ class NHDRReader:
         :returns: Volume shape.
         :rtype: tuple[int, int, int]
         """
-        return self._dim_x, self._dim_y, self._dim_z
+        return self._shape
 
     @property
     def spacing(self) -> tuple[float, float, float]:
@@ -279,7 +335,7 @@ class NHDRReader:
         :returns: Spacing tuple ``(spacing_x, spacing_y, spacing_z)``.
         :rtype: tuple[float, float, float]
         """
-        return self._spacing_x, self._spacing_y, self._spacing_z
+        return self._spacing
 
     def __repr__(self) -> str:
         """
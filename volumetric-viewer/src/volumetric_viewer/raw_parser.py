@@ -1,9 +1,15 @@
+import math
+import os
 import re
+import sys
 
 import numpy as np
 
 from volumetric_viewer.data_type_enum import DataType
 
+# Volume shape and data type encoded in the file name, e.g. ``128x128x64_uint8.raw``
+_RAW_NAME_RE = re.compile(r"(\d+)x(\d+)x(\d+)_([a-zA-Z0-9]+)\.raw$")
+
 
 class RawParser:
     """
@@ -14,49 +20,79 @@ class RawParser:
     Example: ``128x128x64_uint8.raw``
     """
 
-    def __init__(self, file_path: str) -> None:
+    def __init__(self, file_path: str, endian: str = sys.byteorder) -> None:
         """
         Initialize the :class:`RawParser` with the path to a `.raw` file.
 
         :param file_path: Path to the `.raw` binary file.
         :type file_path: str
+        :param endian: Byte order of the stored values, ``"little"`` or ``"big"``.
+                       Defaults to the native byte order.
+        :type endian: str
         :raises NameError: If the filename format is invalid and does not match the required pattern.
+        :raises ValueError: If ``endian`` is neither ``"little"`` nor ``"big"``.
         """
+        if endian not in ("little", "big"):
+            raise ValueError(f"Invalid endian '{endian}'. Expected 'little' or 'big'")
+
         self._file_path: str = file_path
-        self._dim_x: int
-        self._dim_y: int
-        self._dim_z: int
+        self._endian: str = endian
+        self._shape: tuple[int, int, int]
         self._d_type: DataType
         self._data: np.ndarray | None = None
 
-        match = re.search(r"(\d+)x(\d+)x(\d+)_([a-zA-Z0-9]+)\.raw$", self._file_path)
+        match = _RAW_NAME_RE.search(os.path.basename(self._file_path))
         if match:
-            self._dim_x, self._dim_y, self._dim_z = map(int, match.group(1, 2, 3))
+            self._shape = tuple(map(int, match.group(1, 2, 3)))
             self._d_type = DataType.from_string(match.group(4))
         else:
             raise NameError("Invalid file name format. Expected: {X}x{Y}x{Z}_{DATATYPE}.raw")
 
     def read_data(self) -> np.ndarray:
         """
-        Read the binary `.raw` file and return its contents as a NumPy array.
+        Map the binary `.raw` file into memory and return it as a read-only NumPy array.
+
+        The file is memory-mapped rather than read, so pages are loaded on demand
+        and the whole volume is never copied into process memory up front.
 
         :raises FileNotFoundError: If the file does not exist.
-        :raises ValueError: If the read data size does not match the expected volume shape.
+        :raises ValueError: If the file size does not match the expected volume shape.
         :returns: The volumetric data read from the file.
         :rtype: numpy.ndarray
         """
         try:
-            self._data = np.fromfile(self._file_path, dtype=self._d_type.value)
+            file_size = os.path.getsize(self._file_path)
         except FileNotFoundError as err:
             raise FileNotFoundError(f"Raw file not found: {self._file_path}") from err
 
-        expected_size = self._dim_x * self._dim_y * self._dim_z
-        if self._data.size != expected_size:
+        itemsize = self._d_type.itemsize
+        expected_size = math.prod(self._shape)
+        if file_size != expected_size * itemsize:
             raise ValueError(
-                f"Unexpected file size: expected {expected_size} elements, got {self._data.size}"
+                f"Unexpected file size: expected {expected_size} elements, "
+                f"got {file_size / itemsize:g}"
             )
 
-        self._data = self._data.reshape((self._dim_x, self._dim_y, self._dim_z))
+        # Start readahead of the whole file now, so the first pass over the
+        # mapping (the normalization) mostly hits the page cache
+        if hasattr(os, "posix_fadvise"):
+            fd = os.open(self._file_path, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            finally:
+                os.close(fd)
+
+        # The mapped view carries the file's byte order, values are swapped
+        # by whatever reads them instead of in a separate pass
+        dtype = self._d_type.dtype.newbyteorder("<" if self._endian == "little" else ">")
+
+        self._data = np.memmap(
+            self._file_path,
+            dtype=dtype,
+            mode="r",
+            shape=self.shape,
+            order="C",
+        )
         return self._data
 
     # ======================
@@ -81,7 +117,7 @@ class RawParser:
         :returns: Size along X.
         :rtype: int
         """
-        return self._dim_x
+        return self._shape[0]
 
     @property
     def dim_y(self) -> int:
@@ -91,7 +127,7 @@ class RawParser:
         :returns: Size along Y.
         :rtype: int
         """
-        return self._dim_y
+        return self._shape[1]
 
     @property
     def dim_z(self) -> int:
@@ -101,7 +137,7 @@ class RawParser:
         :returns: Size along Z.
         :rtype: int
         """
-        return self._dim_z
+        return self._shape[2]
 
     @property
     def shape(self) -> tuple[int, int, int]:
@@ -111,7 +147,7 @@ class RawParser:
         :returns: Volume shape.
         :rtype: tuple[int, int, int]
         """
-        return self._dim_x, self._dim_y, self._dim_z
+        return self._shape
 
     @property
     def d_type(self) -> DataType:
@@ -123,6 +159,16 @@ class RawParser:
         """
         return self._d_type
 
+    @property
+    def endian(self) -> str:
+        """
+        The byte order of the values stored in the file, ``"little"`` or ``"big"``.
+
+        :returns: Byte order.
+        :rtype: str
+        """
+        return self._endian
+
     @property
     def file_path(self) -> str:
         """
@@ -141,6 +187,6 @@ class RawParser:
         :rtype: str
         """
         return (
-            f"<RawParser shape=({self._dim_x}, {self._dim_y}, {self._dim_z}) "
+            f"<RawParser shape={self._shape} "
             f"type={self._d_type} path={self._file_path}>"
         )
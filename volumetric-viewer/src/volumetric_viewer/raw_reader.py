@@ -29,13 +29,8 @@ class RawReader:
         """
         self._raw_file_path: str = file_path
         self._dimension: int
-        self._spacing_x: float
-        self._spacing_y: float
-        self._spacing_z: float
-
-        self._dim_x: int
-        self._dim_y: int
-        self._dim_z: int
+        self._spacing: tuple[float, float, float]
+        self._shape: tuple[int, int, int]
 
         self._d_type: DataType
         self._data: np.ndarray
@@ -57,15 +52,11 @@ class RawReader:
         
         raw_parser = RawParser(self._raw_file_path)
         self._data = raw_parser.read_data()
-        self._dim_x = raw_parser.dim_x
-        self._dim_y = raw_parser.dim_y
-        self._dim_z = raw_parser.dim_z
+        self._shape = raw_parser.shape
         self._d_type = raw_parser.d_type
 
         # Default voxel spacing (can't be overwritten for now)
-        self._spacing_x = 1.0
-        self._spacing_y = 1.0
-        self._spacing_z = 1.0
+        self._spacing = (1.0, 1.0, 1.0)
         self._dimension = 3
 
     # ======================
@@ -90,7 +81,7 @@ class RawReader:
         :returns: Spacing value along the X axis.
         :rtype: float
         """
-        return self._spacing_x
+        return self._spacing[0]
 
     @property
     def spacing_y(self) -> float:
@@ -100,7 +91,7 @@ class RawReader:
         :returns: Spacing value along the Y axis.
         :rtype: float
         """
-        return self._spacing_y
+        return self._spacing[1]
 
     @property
     def spacing_z(self) -> float:
@@ -110,7 +101,7 @@ class RawReader:
         :returns: Spacing value along the Z axis.
         :rtype: float
         """
-        return self._spacing_z
+        return self._spacing[2]
 
     @property
     def dim_x(self) -> int:
@@ -120,7 +111,7 @@ class RawReader:
         :returns: Number of voxels along X.
         :rtype: int
         """
-        return self._dim_x
+        return self._shape[0]
 
     @property
     def dim_y(self) -> int:
@@ -130,7 +121,7 @@ class RawReader:
         :returns: Number of voxels along Y.
         :rtype: int
         """
-        return self._dim_y
+        return self._shape[1]
 
     @property
     def dim_z(self) -> int:
@@ -140,7 +131,7 @@ class RawReader:
         :returns: Number of voxels along Z.
         :rtype: int
         """
-        return self._dim_z
+        return self._shape[2]
 
     @property
     def d_type(self) -> DataType:
@@ -170,7 +161,7 @@ class RawReader:
         :returns: The volume shape as ``(dim_x, dim_y, dim_z)``.
         :rtype: tuple[int, int, int]
         """
-        return self._dim_x, self._dim_y, self._dim_z
+        return self._shape
 
     @property
     def spacing(self) -> tuple[float, float, float]:
@@ -180,7 +171,7 @@ class RawReader:
         :returns: Spacing tuple ``(spacing_x, spacing_y, spacing_z)``.
         :rtype: tuple[float, float, float]
         """
-        return self._spacing_x, self._spacing_y, self._spacing_z
+        return self._spacing
 
     def __repr__(self) -> str:
         """
@@ -1,32 +1,19 @@
 from OpenGL.GL import (
-    GL_ARRAY_BUFFER,
-    GL_ELEMENT_ARRAY_BUFFER,
-    GL_FALSE,
-    GL_FLOAT,
-    GL_STATIC_DRAW,
-    GL_TEXTURE0,
-    GL_TEXTURE_3D,
-    GL_TRIANGLES,
-    GL_UNSIGNED_INT,
-    GLfloat,
-    GLuint,
-    glActiveTexture,
-    glBindBuffer,
-    glBindTexture,
+    GL_TRIANGLE_STRIP,
     glBindVertexArray,
-    glBufferData,
-    glDrawElements,
-    glEnableVertexAttribArray,
-    glGenBuffers,
+    glDeleteVertexArrays,
+    glDrawArrays,
     glGenVertexArrays,
     glGetUniformLocation,
     glUniform1i,
     glUseProgram,
-    glVertexAttribPointer,
 )
 
 from volumetric_viewer.volume import Volume
 
+# Vertices of the cube's triangle strip (12 triangles), generated by the vertex shader
+_CUBE_VERTEX_COUNT = 14
+
 
 class Renderer:
     """
@@ -42,56 +29,23 @@ class Renderer:
             shader_program (int): The compiled OpenGL shader program ID.
         """
         self._volume: Volume | None = None
+        # Volume whose texture is still uploading, shown once the upload completes
+        self._pending_volume: Volume | None = None
         self._shader_program = shader_program
+        # Looked up once, the location is fixed for the lifetime of the linked program
+        self._volume_tex_location = glGetUniformLocation(shader_program, "volumeTex")
         self._vao = self._create_cube_vao()
 
     def _create_cube_vao(self) -> int:
         """
-        Creates the necessary buffers to render a unit cube.
+        Creates the VAO the unit cube is drawn with.
+        It has no buffers, the vertex shader builds the cube corners from gl_VertexID.
 
         Returns:
             int: The generated Vertex Array Object (VAO) ID.
         """
-        # Cube vertices (positions from 0 to 1 in each axis)
-        vertices = [
-            0, 0, 0,
-            1, 0, 0,
-            1, 1, 0,
-            0, 1, 0,
-            0, 0, 1,
-            1, 0, 1,
-            1, 1, 1,
-            0, 1, 1,
-        ]
-
-        # Indices for the cube's triangles (12 triangles, 36 indices)
-        indices = [
-            0, 1, 2, 2, 3, 0,  # face z-
-            4, 5, 6, 6, 7, 4,  # face z+
-            0, 4, 7, 7, 3, 0,  # face x-
-            1, 5, 6, 6, 2, 1,  # face x+
-            3, 2, 6, 6, 7, 3,  # face y+
-            0, 1, 5, 5, 4, 0   # face y-
-        ]
-
-        # Create VAO, VBO, and EBO
-        vao = glGenVertexArrays(1)
-        glBindVertexArray(vao)
-
-        vbo = glGenBuffers(1)
-        glBindBuffer(GL_ARRAY_BUFFER, vbo)
-        glBufferData(GL_ARRAY_BUFFER, len(vertices) * 4, (GLfloat * len(vertices))(*vertices), GL_STATIC_DRAW)
-
-        ebo = glGenBuffers(1)
-        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, ebo)
-        glBufferData(GL_ELEMENT_ARRAY_BUFFER, len(indices) * 4, (GLuint * len(indices))(*indices), GL_STATIC_DRAW)
-
-        # Vertex attribute: position (3 floats)
-        glEnableVertexAttribArray(0)
-        glVertexAttribPointer(0, 3, GL_FLOAT, GL_FALSE, 0, None)
-
-        glBindVertexArray(0)
-        return vao
+        # Core profile still requires a bound VAO, even without attributes
+        return glGenVertexArrays(1)
 
     def render(self) -> None:
         """
@@ -103,19 +57,16 @@ class Renderer:
         glUseProgram(self._shader_program)
         glBindVertexArray(self._vao)
 
-        # Bind 3D texture to texture unit 0
-        glActiveTexture(GL_TEXTURE0)
-        glBindTexture(GL_TEXTURE_3D, self._volume.texture_id)
+        # Bind 3D texture to texture unit 0, a no-op while it stays bound between frames
+        self._volume.bind(0)
 
         # Set shader uniform for volume texture
-        location = glGetUniformLocation(self._shader_program, "volumeTex")
-        glUniform1i(location, 0)
+        glUniform1i(self._volume_tex_location, 0)
 
-        # Draw cube with triangles
-        glDrawElements(GL_TRIANGLES, 36, GL_UNSIGNED_INT, None)
+        # Draw cube as a single triangle strip
+        glDrawArrays(GL_TRIANGLE_STRIP, 0, _CUBE_VERTEX_COUNT)
 
-        # Unbind everything
-        glBindTexture(GL_TEXTURE_3D, 0)
+        # Unbind everything but the texture, which is rebound next frame anyway
         glBindVertexArray(0)
         glUseProgram(0)
 
@@ -125,13 +76,44 @@ class Renderer:
     def update_volume(self, new_volume: Volume) -> None:
         """
         Updates the renderer to use a new volume.
+        The current volume keeps being rendered until the new texture upload finishes
+        and :meth:`swap_pending_volume` switches to it.
+
         Args:
             new_volume (Volume): The volume containing the new uploaded 3D texture.
         """
+        if self._pending_volume is not None:
+            self._pending_volume.delete()
+
+        self._pending_volume = new_volume
+
+    def swap_pending_volume(self) -> None:
+        """
+        Replaces the current volume with the pending one once its upload has finished.
+        Called once per frame, before the volume's uniforms are set.
+        """
+        if self._pending_volume is None or not self._pending_volume.is_uploaded:
+            return
+
         if self._volume is not None:
             self._volume.delete()
 
-        self._volume = new_volume
+        self._volume = self._pending_volume
+        self._pending_volume = None
+
+    def delete(self) -> None:
+        """
+        Deletes the displayed and the pending volume, and the cube VAO, from GPU memory.
+        """
+        for volume in (self._volume, self._pending_volume):
+            if volume is not None:
+                volume.delete()
+        self._volume = None
+        self._pending_volume = None
+
+        if self._vao is not None:
+            glDeleteVertexArrays(1, [self._vao])
+            self._vao = None
 
     @property
     def scale_factors(self):
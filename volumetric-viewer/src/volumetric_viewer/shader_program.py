@@ -1,10 +1,20 @@
+import hashlib
 import os
 
+import numpy as np
+from OpenGL.error import GLError
 from OpenGL.GL import (
     GL_COMPILE_STATUS,
     GL_FALSE,
     GL_FRAGMENT_SHADER,
     GL_LINK_STATUS,
+    GL_NUM_PROGRAM_BINARY_FORMATS,
+    GL_PROGRAM_BINARY_LENGTH,
+    GL_PROGRAM_BINARY_RETRIEVABLE_HINT,
+    GL_RENDERER,
+    GL_TRUE,
+    GL_VENDOR,
+    GL_VERSION,
     GL_VERTEX_SHADER,
     glAttachShader,
     glCompileShader,
@@ -12,12 +22,17 @@ from OpenGL.GL import (
     glCreateShader,
     glDeleteProgram,
     glDeleteShader,
+    glGetIntegerv,
+    glGetProgramBinary,
     glGetProgramInfoLog,
     glGetProgramiv,
     glGetShaderInfoLog,
     glGetShaderiv,
+    glGetString,
     glGetUniformLocation,
     glLinkProgram,
+    glProgramBinary,
+    glProgramParameteri,
     glShaderSource,
     glUniform1f,
     glUniform1i,
@@ -26,6 +41,35 @@ from OpenGL.GL import (
     glUseProgram,
 )
 
+# Linked program binaries are cached here, keyed by shader sources and driver
+DEFAULT_BINARY_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+    "volumetric_viewer",
+    "shaders",
+)
+
+
+class UniformLocation:
+    """
+    Handle to a uniform of a linked program, returned by :meth:`ShaderProgram.resolve`.
+
+    Setting a uniform through its handle skips the lookup by name.
+
+    :ivar location: OpenGL uniform location, ``-1`` if the uniform was not found.
+    :vartype location: int
+    :ivar value: Last value sent to the uniform, ``None`` if it was never set.
+    :vartype value: object
+    """
+
+    __slots__ = ("location", "value")
+
+    def __init__(self, location: int) -> None:
+        self.location = location
+        self.value = None
+
+    def __repr__(self) -> str:
+        return f"<UniformLocation location={self.location}>"
+
 
 class ShaderProgram:
     """
@@ -52,22 +96,37 @@ class ShaderProgram:
     :vartype fragment_shader_path: str
     :ivar program_id: OpenGL handle for the linked shader program.
     :vartype program_id: int | None
+    :ivar binary_cache_dir: Directory of the program binary cache, ``None`` if disabled.
+    :vartype binary_cache_dir: str | None
     """
 
-    def __init__(self, vertex_shader_path: str, fragment_shader_path: str) -> None:
+    def __init__(
+        self,
+        vertex_shader_path: str,
+        fragment_shader_path: str,
+        binary_cache_dir: str | None = DEFAULT_BINARY_CACHE_DIR,
+    ) -> None:
         """
         Initialize and compile the shader program from the specified vertex and fragment shader files.
 
+        When a program binary cached by a previous run matches the sources and the
+        driver, it is loaded instead of compiling the shaders.
+
         :param vertex_shader_path: Path to the vertex shader file.
         :type vertex_shader_path: str
         :param fragment_shader_path: Path to the fragment shader file.
         :type fragment_shader_path: str
+        :param binary_cache_dir: Directory to cache linked program binaries in, ``None`` to always compile.
+        :type binary_cache_dir: str | None
         :raises FileNotFoundError: If a shader source file cannot be found.
         :raises RuntimeError: If shader compilation or program linking fails.
         """
         self.vertex_shader_path = vertex_shader_path
         self.fragment_shader_path = fragment_shader_path
+        self.binary_cache_dir = binary_cache_dir
         self.program_id = None
+        # Uniform handles by name, locations stay fixed for the lifetime of the linked program
+        self._uniform_locations: dict[str, UniformLocation] = {}
 
         self._create_program()
 
@@ -123,10 +182,18 @@ class ShaderProgram:
         vertex_source = self._read_shader_source(self.vertex_shader_path)
         fragment_source = self._read_shader_source(self.fragment_shader_path)
 
+        cache_path = self._binary_cache_path(vertex_source, fragment_source)
+        if cache_path is not None:
+            self.program_id = self._load_program_binary(cache_path)
+            if self.program_id is not None:
+                return
+
         vertex_shader = self._compile_shader(vertex_source, GL_VERTEX_SHADER)
         fragment_shader = self._compile_shader(fragment_source, GL_FRAGMENT_SHADER)
 
         program = glCreateProgram()
+        if cache_path is not None:
+            glProgramParameteri(program, GL_PROGRAM_BINARY_RETRIEVABLE_HINT, GL_TRUE)
         glAttachShader(program, vertex_shader)
         glAttachShader(program, fragment_shader)
         glLinkProgram(program)
@@ -144,6 +211,89 @@ class ShaderProgram:
         glDeleteShader(fragment_shader)
 
         self.program_id = program
+        if cache_path is not None:
+            self._save_program_binary(program, cache_path)
+
+    def _binary_cache_path(self, vertex_source: str, fragment_source: str) -> str | None:
+        """
+        Get the cache file of the program binary for the given sources on the current driver.
+
+        :param vertex_source: Vertex shader source code.
+        :type vertex_source: str
+        :param fragment_source: Fragment shader source code.
+        :type fragment_source: str
+        :returns: Path of the cache file, or ``None`` if caching is disabled or unsupported.
+        :rtype: str | None
+        """
+        if self.binary_cache_dir is None or not bool(glGetProgramBinary):
+            return None
+        if glGetIntegerv(GL_NUM_PROGRAM_BINARY_FORMATS) == 0:
+            return None
+
+        # Binaries are only valid for the driver that produced them
+        key = hashlib.sha256()
+        key.update(vertex_source.encode("utf-8") + b"\x00" + fragment_source.encode("utf-8"))
+        for name in (GL_VENDOR, GL_RENDERER, GL_VERSION):
+            key.update(b"\x00" + (glGetString(name) or b""))
+        return os.path.join(self.binary_cache_dir, f"{key.hexdigest()}.bin")
+
+    def _load_program_binary(self, cache_path: str) -> int | None:
+        """
+        Create a program from a cached binary.
+
+        :param cache_path: Path of the cache file.
+        :type cache_path: str
+        :returns: The linked program ID, or ``None`` if there is no usable binary.
+        :rtype: int | None
+        """
+        try:
+            with open(cache_path, "rb") as file:
+                binary_format = int.from_bytes(file.read(4), "little")
+                binary = file.read()
+        except OSError:
+            return None
+
+        program = glCreateProgram()
+        try:
+            glProgramBinary(program, binary_format, binary, len(binary))
+        except GLError:
+            glDeleteProgram(program)
+            return None
+
+        # The driver rejects binaries it can no longer load, e.g. after an update
+        if not glGetProgramiv(program, GL_LINK_STATUS):
+            glDeleteProgram(program)
+            return None
+        return program
+
+    def _save_program_binary(self, program: int, cache_path: str) -> None:
+        """
+        Write the binary of a linked program to the cache. Failures are ignored,
+        the program is compiled again on the next run.
+
+        :param program: Linked program ID.
+        :type program: int
+        :param cache_path: Path of the cache file.
+        :type cache_path: str
+        """
+        size = glGetProgramiv(program, GL_PROGRAM_BINARY_LENGTH)
+        if size == 0:
+            return
+
+        binary = np.empty(size, dtype=np.uint8)
+        length = np.zeros(1, dtype=np.int32)
+        binary_format = np.zeros(1, dtype=np.uint32)
+        try:
+            glGetProgramBinary(program, size, length, binary_format, binary)
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            # Written aside and renamed, so concurrent runs never read a partial file
+            temp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(temp_path, "wb") as file:
+                file.write(int(binary_format[0]).to_bytes(4, "little"))
+                file.write(binary[:length[0]].tobytes())
+            os.replace(temp_path, cache_path)
+        except (GLError, OSError) as error:
+            print(f"Warning: Could not cache shader program binary: {error}")
 
     def use(self) -> None:
         """
@@ -162,6 +312,27 @@ class ShaderProgram:
         """
         glUseProgram(0)
 
+    def resolve(self, name: str) -> UniformLocation:
+        """
+        Get the handle of a uniform variable within the shader program.
+
+        The driver is only queried the first time a name is resolved. Callers
+        setting a uniform every frame should keep the handle and use the
+        ``*_loc`` setters. Handles are invalidated by :meth:`delete`.
+
+        :param name: Name of the uniform variable as defined in GLSL.
+        :type name: str
+        :returns: The uniform handle, with location ``-1`` if the uniform was not found.
+        :rtype: UniformLocation
+        """
+        uniform = self._uniform_locations.get(name)
+        if uniform is None:
+            location = glGetUniformLocation(self.program_id, name)
+            if location == -1:
+                print(f"Warning: Uniform '{name}' not found in shader.")
+            uniform = self._uniform_locations[name] = UniformLocation(location)
+        return uniform
+
     def get_uniform_location(self, name: str) -> int:
         """
         Retrieve the location of a uniform variable within the shader program.
@@ -171,10 +342,24 @@ class ShaderProgram:
         :returns: The uniform location, or ``-1`` if the uniform was not found.
         :rtype: int
         """
-        location = glGetUniformLocation(self.program_id, name)
-        if location == -1:
-            print(f"Warning: Uniform '{name}' not found in shader.")
-        return location
+        return self.resolve(name).location
+
+    @staticmethod
+    def _needs_upload(uniform: UniformLocation, value) -> bool:
+        """
+        Check whether a uniform must be sent to the driver, recording ``value`` as its last value.
+
+        :param uniform: Handle of the uniform.
+        :type uniform: UniformLocation
+        :param value: Hashable snapshot of the value about to be set.
+        :type value: object
+        :returns: ``False`` if the uniform does not exist or already holds ``value``.
+        :rtype: bool
+        """
+        if uniform.location == -1 or uniform.value == value:
+            return False
+        uniform.value = value
+        return True
 
     def set_uniform1i(self, name: str, value: int) -> None:
         """
@@ -185,9 +370,19 @@ class ShaderProgram:
         :param value: Integer value to assign.
         :type value: int
         """
-        location = self.get_uniform_location(name)
-        if location != -1:
-            glUniform1i(location, value)
+        self.set_uniform1i_loc(self.resolve(name), value)
+
+    def set_uniform1i_loc(self, uniform: UniformLocation, value: int) -> None:
+        """
+        Set an integer uniform variable through its handle.
+
+        :param uniform: Handle of the uniform variable.
+        :type uniform: UniformLocation
+        :param value: Integer value to assign.
+        :type value: int
+        """
+        if self._needs_upload(uniform, value):
+            glUniform1i(uniform.location, value)
 
     def set_uniform1f(self, name: str, value: float) -> None:
         """
@@ -198,9 +393,19 @@ class ShaderProgram:
         :param value: Floating-point value to assign.
         :type value: float
         """
-        location = self.get_uniform_location(name)
-        if location != -1:
-            glUniform1f(location, value)
+        self.set_uniform1f_loc(self.resolve(name), value)
+
+    def set_uniform1f_loc(self, uniform: UniformLocation, value: float) -> None:
+        """
+        Set a floating-point uniform variable through its handle.
+
+        :param uniform: Handle of the uniform variable.
+        :type uniform: UniformLocation
+        :param value: Floating-point value to assign.
+        :type value: float
+        """
+        if self._needs_upload(uniform, float(value)):
+            glUniform1f(uniform.location, value)
 
     def set_uniform_vec3(self, name: str, vec3) -> None:
         """
@@ -211,9 +416,20 @@ class ShaderProgram:
         :param vec3: Iterable of 3 float values representing the vector (x, y, z).
         :type vec3: Iterable[float]
         """
-        location = self.get_uniform_location(name)
-        if location != -1:
-            glUniform3f(location, *vec3)
+        self.set_uniform_vec3_loc(self.resolve(name), vec3)
+
+    def set_uniform_vec3_loc(self, uniform: UniformLocation, vec3) -> None:
+        """
+        Set a ``vec3`` uniform variable through its handle.
+
+        :param uniform: Handle of the uniform variable.
+        :type uniform: UniformLocation
+        :param vec3: Iterable of 3 float values representing the vector (x, y, z).
+        :type vec3: Iterable[float]
+        """
+        vec3 = tuple(vec3)
+        if self._needs_upload(uniform, vec3):
+            glUniform3f(uniform.location, *vec3)
 
     def set_uniform_mat4(self, name: str, matrix) -> None:
         """
@@ -225,9 +441,21 @@ class ShaderProgram:
                        or a flat list of 16 floats.
         :type matrix: numpy.ndarray | list[float]
         """
-        location = self.get_uniform_location(name)
-        if location != -1:
-            glUniformMatrix4fv(location, 1, GL_FALSE, matrix)
+        self.set_uniform_mat4_loc(self.resolve(name), matrix)
+
+    def set_uniform_mat4_loc(self, uniform: UniformLocation, matrix) -> None:
+        """
+        Set a ``mat4`` uniform variable through its handle.
+
+        :param uniform: Handle of the uniform variable.
+        :type uniform: UniformLocation
+        :param matrix: A 4x4 transformation matrix as a NumPy array (``dtype=float32``)
+                       or a flat list of 16 floats.
+        :type matrix: numpy.ndarray | list[float]
+        """
+        matrix = np.asarray(matrix, dtype=np.float32)
+        if self._needs_upload(uniform, matrix.tobytes()):
+            glUniformMatrix4fv(uniform.location, 1, GL_FALSE, matrix)
 
     def delete(self) -> None:
         """
@@ -236,9 +464,10 @@ class ShaderProgram:
         This should be called when the shader program is no longer needed,
         to free GPU resources.
         """
-        if self.program_id:
+        if self.program_id is not None:
             glDeleteProgram(self.program_id)
             self.program_id = None
+        self._uniform_locations.clear()
 
     def __repr__(self) -> str:
         """
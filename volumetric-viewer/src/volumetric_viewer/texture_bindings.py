@@ -0,0 +1,67 @@
+import numpy as np
+from OpenGL.GL import (
+    GL_TEXTURE0,
+    glActiveTexture,
+    glBindTexture,
+    glCreateTextures,
+    glDeleteTextures,
+)
+
+# Mirror of the GL texture binding state, only valid while every glActiveTexture
+# and glBindTexture call of the context goes through this module
+_active_unit = 0
+# Texture bound to each (texture unit, target), units not in here are unknown
+_bound_textures: dict[tuple[int, int], int] = {}
+
+
+def bind_texture(target: int, texture_id: int, texture_unit: int | None = None) -> None:
+    """
+    Binds a texture, skipping the GL calls whose state is already current.
+
+    Args:
+        target (int): Texture target, e.g. GL_TEXTURE_3D.
+        texture_id (int): Texture to bind, 0 to unbind the target.
+        texture_unit (int | None): Index of the texture unit. Default is the active unit.
+    """
+    global _active_unit
+
+    if texture_unit is None:
+        texture_unit = _active_unit
+    if _bound_textures.get((texture_unit, target)) == texture_id:
+        return
+
+    if texture_unit != _active_unit:
+        glActiveTexture(GL_TEXTURE0 + texture_unit)
+        _active_unit = texture_unit
+    glBindTexture(target, texture_id)
+    _bound_textures[(texture_unit, target)] = texture_id
+
+
+def create_texture(target: int) -> int:
+    """
+    Creates a texture for direct state access, without binding it.
+
+    Args:
+        target (int): Texture target, e.g. GL_TEXTURE_3D.
+
+    Returns:
+        int: The new texture ID.
+    """
+    texture_ids = np.zeros(1, dtype=np.uint32)
+    glCreateTextures(target, 1, texture_ids)
+    return int(texture_ids[0])
+
+
+def delete_texture(texture_id: int) -> None:
+    """
+    Deletes a texture and forgets its bindings.
+
+    Args:
+        texture_id (int): Texture to delete.
+    """
+    glDeleteTextures([texture_id])
+    # GL reverts the units the texture was bound to to texture 0, and may hand
+    # the same id out again from create_texture
+    for binding, bound_id in _bound_textures.items():
+        if bound_id == texture_id:
+            _bound_textures[binding] = 0
@@ -1,115 +1,128 @@
+from bisect import insort
+
 import numpy as np
 from OpenGL.GL import (
     GL_CLAMP_TO_EDGE,
-    GL_FLOAT,
+    GL_HALF_FLOAT,
     GL_LINEAR,
     GL_RGBA,
-    GL_RGBA32F,
-    GL_TEXTURE0,
+    GL_RGBA16F,
     GL_TEXTURE_1D,
     GL_TEXTURE_MAG_FILTER,
     GL_TEXTURE_MIN_FILTER,
     GL_TEXTURE_WRAP_S,
-    glActiveTexture,
-    glBindTexture,
-    glDeleteTextures,
-    glGenTextures,
-    glTexImage1D,
-    glTexParameteri,
+    glTextureParameteri,
+    glTextureStorage1D,
+    glTextureSubImage1D,
 )
 
+from volumetric_viewer.texture_bindings import bind_texture, create_texture, delete_texture
+
 
 class TransferFunction:
     def __init__(self, size=256):
         self.size = size
+        self.texture_id = None
+        # Knot intensities and values as arrays, rebuilt only when the knots change
+        self._color_x = np.empty(0, dtype=np.float32)
+        self._color_rgb = np.empty((0, 3), dtype=np.float32)
+        self._alpha_x = np.empty(0, dtype=np.float32)
+        self._alpha_a = np.empty(0, dtype=np.float32)
+        self._xs = np.arange(size, dtype=np.float32)
+        # Reused by every regeneration
+        self._tf_data = np.zeros((size, 4), dtype=np.float32)
+        # Half floats are plenty for interpolated colors and halve the texel size
+        self._tf_half = np.zeros((size, 4), dtype=np.float16)
         self.color_knots = []
         self.alpha_knots = []
-        self.texture_id = None
+
+    @property
+    def color_knots(self):
+        return self._color_knots
+
+    @color_knots.setter
+    def color_knots(self, knots):
+        self._color_knots = knots
+        self._rebuild_color_arrays()
+
+    @property
+    def alpha_knots(self):
+        return self._alpha_knots
+
+    @alpha_knots.setter
+    def alpha_knots(self, knots):
+        self._alpha_knots = knots
+        self._rebuild_alpha_arrays()
+
+    def _rebuild_color_arrays(self):
+        color_knots = np.asarray(self._color_knots, dtype=np.float32).reshape(-1, 4)
+        self._color_x = np.ascontiguousarray(color_knots[:, 0])
+        self._color_rgb = np.ascontiguousarray(color_knots[:, 1:])
+
+    def _rebuild_alpha_arrays(self):
+        alpha_knots = np.asarray(self._alpha_knots, dtype=np.float32).reshape(-1, 2)
+        self._alpha_x = np.ascontiguousarray(alpha_knots[:, 0])
+        self._alpha_a = np.ascontiguousarray(alpha_knots[:, 1])
 
     def add_color_knot(self, r, g, b, intensity):
-        self.color_knots.append((intensity, r, g, b)) 
-        self.color_knots.sort(key=lambda x: x[0])  
+        # Kept sorted by intensity, a new knot goes after the knots of equal intensity
+        insort(self._color_knots, (intensity, r, g, b), key=lambda x: x[0])
+        self._rebuild_color_arrays()
 
     def add_alpha_knot(self, alpha, intensity):
-        self.alpha_knots.append((intensity, alpha))  
-        self.alpha_knots.sort(key=lambda x: x[0])  
-
-    def _interp_knots(self, knots, x, is_color=True):
-        if not knots:
-            return (0.0, 0.0, 0.0) if is_color else 0.0
-
-        first = knots[0]
-        last = knots[-1]
-
-        x_first = first[0] 
-        x_last = last[0]    
-
-        if x <= x_first:
-            return first[1:] if is_color else first[1]
-        if x >= x_last:
-            return last[1:] if is_color else last[1]
-
-        for i in range(len(knots) - 1):
-            x0 = knots[i][0]  
-            x1 = knots[i+1][0]  
-            if x0 <= x <= x1:
-                t = (x - x0) / (x1 - x0)
-                if is_color:
-                    r0, g0, b0 = knots[i][1:]
-                    r1, g1, b1 = knots[i+1][1:]
-                    return (
-                        r0 * (1 - t) + r1 * t,
-                        g0 * (1 - t) + g1 * t,
-                        b0 * (1 - t) + b1 * t
-                    )
-                else:
-                    a0 = knots[i][1]
-                    a1 = knots[i+1][1]
-                    return a0 * (1 - t) + a1 * t
-
-        return (0.0, 0.0, 0.0) if is_color else 0.0
+        insort(self._alpha_knots, (intensity, alpha), key=lambda x: x[0])
+        self._rebuild_alpha_arrays()
 
     def generate_texture_data(self):
-        tf_data = np.zeros((self.size, 4), dtype=np.float32)
+        # The returned buffer is overwritten by the next call
+        tf_data = self._tf_data
+
+        # np.interp clamps to the first/last knot outside the knot range
+        if len(self._color_x) > 0:
+            for channel in range(3):
+                tf_data[:, channel] = np.interp(self._xs, self._color_x, self._color_rgb[:, channel])
+        else:
+            tf_data[:, :3] = 0.0
 
-        for i in range(self.size):
-            r, g, b = self._interp_knots(self.color_knots, i, is_color=True)
-            a = self._interp_knots(self.alpha_knots, i, is_color=False)
-            tf_data[i] = [r, g, b, a]
+        if len(self._alpha_x) > 0:
+            tf_data[:, 3] = np.interp(self._xs, self._alpha_x, self._alpha_a)
+        else:
+            tf_data[:, 3] = 0.0
 
         return tf_data
     
     def update(self, color_knots=None, alpha_knots=None):
         if color_knots is not None:
-            self.color_knots = color_knots
-            self.color_knots.sort(key=lambda x: x[0])
+            # Sorted into a new list, the GUI sends the color knots as an (N, 4) array
+            self.color_knots = sorted(color_knots, key=lambda x: x[0])
         if alpha_knots is not None:
-            self.alpha_knots = alpha_knots
-            self.alpha_knots.sort(key=lambda x: x[0])
-        if self.texture_id is not None:
-            glDeleteTextures([self.texture_id])
-            self.texture_id = None
+            self.alpha_knots = sorted(alpha_knots, key=lambda x: x[0])
         self.upload_to_gpu()
 
+    def _ensure_texture(self):
+        if self.texture_id is not None:
+            return
+        # Storage is allocated once, updates only replace the texels
+        self.texture_id = create_texture(GL_TEXTURE_1D)
+        glTextureStorage1D(self.texture_id, 1, GL_RGBA16F, self.size)
+        glTextureParameteri(self.texture_id, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+        glTextureParameteri(self.texture_id, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+        glTextureParameteri(self.texture_id, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
+
     def upload_to_gpu(self):
-        tf_data = self.generate_texture_data()
-        self.texture_id = glGenTextures(1)
-        glBindTexture(GL_TEXTURE_1D, self.texture_id)
-        glTexImage1D(GL_TEXTURE_1D, 0, GL_RGBA32F, self.size, 0, GL_RGBA, GL_FLOAT, tf_data)
-        glTexParameteri(GL_TEXTURE_1D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_1D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_1D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
-        glBindTexture(GL_TEXTURE_1D, 0)
+        np.copyto(self._tf_half, self.generate_texture_data(), casting="same_kind")
+        self._ensure_texture()
+        # Direct state access, the texture bindings are left untouched
+        glTextureSubImage1D(self.texture_id, 0, 0, self.size, GL_RGBA, GL_HALF_FLOAT, self._tf_half)
 
     def bind(self, texture_unit):
         if len(self.color_knots) == 0 or len(self.alpha_knots)==0:
             return
-        glActiveTexture(GL_TEXTURE0 + texture_unit)
-        glBindTexture(GL_TEXTURE_1D, self.texture_id)
+        bind_texture(GL_TEXTURE_1D, self.texture_id, texture_unit)
 
     def delete(self):
-        if self.texture_id:
-            glDeleteTextures([self.texture_id])
+        if self.texture_id is not None:
+            delete_texture(self.texture_id)
             self.texture_id = None
 
     def get_alpha_knots(self):
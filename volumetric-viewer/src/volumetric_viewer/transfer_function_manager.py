@@ -1,3 +1,5 @@
+import numpy as np
+
 from volumetric_viewer.transfer_function import TransferFunction
 
 
@@ -16,10 +18,12 @@ class TransferFunctionManager:
         }
 
         with open(file=filename) as file:
-            for line in file:
-                values = line.strip().split()
-                if len(values) == 2:
-                    data["alpha_knots"].append((float(values[0]), float(values[1])))
+            alpha_lines = [line for line in file if len(line.split()) == 2]
+
+        # Parsed in one call, the GUI keeps the knots as (intensity, alpha) tuples
+        if alpha_lines:
+            alpha_knots = np.loadtxt(alpha_lines, dtype=np.float64, ndmin=2)
+            data["alpha_knots"] = list(map(tuple, alpha_knots.tolist()))
         
         data["color_knots"] = colors
 
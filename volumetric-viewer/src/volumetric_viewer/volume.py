@@ -1,26 +1,55 @@
+import ctypes
+
 import numpy as np
 from OpenGL.GL import (
+    GL_ALREADY_SIGNALED,
     GL_CLAMP_TO_EDGE,
+    GL_CONDITION_SATISFIED,
     GL_FLOAT,
     GL_LINEAR,
+    GL_MAP_INVALIDATE_BUFFER_BIT,
+    GL_MAP_WRITE_BIT,
+    GL_PIXEL_UNPACK_BUFFER,
+    GL_R8,
+    GL_R16,
+    GL_R32F,
     GL_RED,
-    GL_TEXTURE0,
+    GL_STREAM_DRAW,
+    GL_SYNC_GPU_COMMANDS_COMPLETE,
     GL_TEXTURE_3D,
     GL_TEXTURE_MAG_FILTER,
     GL_TEXTURE_MIN_FILTER,
     GL_TEXTURE_WRAP_R,
     GL_TEXTURE_WRAP_S,
     GL_TEXTURE_WRAP_T,
-    glActiveTexture,
-    glBindTexture,
-    glDeleteTextures,
-    glGenTextures,
-    glTexImage3D,
-    glTexParameteri,
+    GL_UNPACK_ALIGNMENT,
+    GL_UNSIGNED_BYTE,
+    GL_UNSIGNED_SHORT,
+    glBindBuffer,
+    glClientWaitSync,
+    glCreateBuffers,
+    glDeleteBuffers,
+    glDeleteSync,
+    glFenceSync,
+    glMapNamedBufferRange,
+    glNamedBufferData,
+    glPixelStorei,
+    glTextureParameteri,
+    glTextureStorage3D,
+    glTextureSubImage3D,
+    glUnmapNamedBuffer,
 )
 
+from volumetric_viewer.texture_bindings import bind_texture, create_texture, delete_texture
 from volumetric_viewer.volume_normalizer import VolumeNormalizer
 
+# Internal format and pixel type of the 3D texture for each normalized data type
+_TEXTURE_FORMATS = {
+    np.dtype(np.uint8): (GL_R8, GL_UNSIGNED_BYTE),
+    np.dtype(np.uint16): (GL_R16, GL_UNSIGNED_SHORT),
+    np.dtype(np.float32): (GL_R32F, GL_FLOAT),
+}
+
 
 class Volume:
     """
@@ -44,65 +73,137 @@ class Volume:
         self._sizes = sizes
         self.texture_id: int | None = None
 
+        # Staging buffer and fence of an upload still in flight
+        self._pbo: int | None = None
+        self._upload_fence = None
+
         normalizer = VolumeNormalizer()
-    
-        self.normalized_data, self._scale_factors = normalizer.normalize(sizes, spacings, raw_data)
+
+        # Densities are stored as normalized integers, which the sampler reads back in
+        # [0, 1]. 8-bit sources keep 8 bits and wider integers 16; floating-point volumes
+        # are quantized to 8 bits, as the isovalue limits and transfer function have
+        # 256 steps anyway. Either is a fraction of the float32 upload and texture memory.
+        if raw_data.dtype.kind in "iu" and raw_data.dtype.itemsize > 1:
+            texture_dtype = np.uint16
+        else:
+            texture_dtype = np.uint8
+
+        normalized_data, self._scale_factors = normalizer.normalize(
+            sizes, spacings, raw_data, dtype=texture_dtype
+        )
+        # Shaped once, uploads copy the buffer as-is. The readers keep the file's
+        # x-fastest order, so this is a view unless the data was not contiguous.
+        self.normalized_data = np.ascontiguousarray(normalized_data).reshape(sizes)
 
     def upload_to_gpu(self) -> None:
         """
         Uploads the normalized volume data to the GPU as a 3D texture.
-        Deletes any existing texture before uploading.
-        """
-        if self.texture_id is not None:
-            glDeleteTextures([self.texture_id])
-
-        self.texture_id = glGenTextures(1)
-        glBindTexture(GL_TEXTURE_3D, self.texture_id)
+        The texture storage is allocated by the first upload, later uploads
+        replace its texels in place.
 
-        data_3d = self.normalized_data.reshape(self._sizes)
-
-        glTexImage3D(
-            GL_TEXTURE_3D,
-            0,              
-            GL_RED,         
+        The data is staged in a pixel buffer object, so the transfer into the
+        texture runs asynchronously; see :attr:`is_uploaded`.
+        """
+        self._release_upload()
+
+        internal_format, pixel_type = _TEXTURE_FORMATS[self.normalized_data.dtype]
+
+        # Direct state access, the texture bindings are left untouched
+        if self.texture_id is None:
+            # Immutable storage, later uploads only replace the texels
+            self.texture_id = create_texture(GL_TEXTURE_3D)
+            glTextureStorage3D(self.texture_id, 1, internal_format, *self._sizes)
+            glTextureParameteri(self.texture_id, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+            glTextureParameteri(self.texture_id, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+            glTextureParameteri(self.texture_id, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
+            glTextureParameteri(self.texture_id, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
+            glTextureParameteri(self.texture_id, GL_TEXTURE_WRAP_R, GL_CLAMP_TO_EDGE)
+
+        pbo_ids = np.zeros(1, dtype=np.uint32)
+        glCreateBuffers(1, pbo_ids)
+        self._pbo = int(pbo_ids[0])
+        glNamedBufferData(self._pbo, self.normalized_data.nbytes, None, GL_STREAM_DRAW)
+        pointer = glMapNamedBufferRange(
+            self._pbo, 0, self.normalized_data.nbytes,
+            GL_MAP_WRITE_BIT | GL_MAP_INVALIDATE_BUFFER_BIT
+        )
+        ctypes.memmove(pointer, self.normalized_data.ctypes.data, self.normalized_data.nbytes)
+        glUnmapNamedBuffer(self._pbo)
+
+        # Rows of 8-bit data are not 4-byte aligned for odd widths
+        glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
+
+        # Texel uploads still read from the bound unpack buffer. With the PBO bound,
+        # the data argument is an offset into it and the call returns without
+        # waiting for the copy
+        glBindBuffer(GL_PIXEL_UNPACK_BUFFER, self._pbo)
+        glTextureSubImage3D(
+            self.texture_id,
+            0,
+            0, 0, 0,
             self._sizes[0], self._sizes[1], self._sizes[2],
-            0,              
-            GL_RED,         
-            GL_FLOAT,       
-            data_3d
+            GL_RED,
+            pixel_type,
+            None
         )
-
-        # Texture parameters
-        glTexParameteri(GL_TEXTURE_3D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_3D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_3D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
-        glTexParameteri(GL_TEXTURE_3D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
-        glTexParameteri(GL_TEXTURE_3D, GL_TEXTURE_WRAP_R, GL_CLAMP_TO_EDGE)
-
-        glBindTexture(GL_TEXTURE_3D, 0)
+        glBindBuffer(GL_PIXEL_UNPACK_BUFFER, 0)
+        self._upload_fence = glFenceSync(GL_SYNC_GPU_COMMANDS_COMPLETE, 0)
 
     def bind(self, texture_unit: int = 0) -> None:
         """
         Binds the texture to the specified texture unit.
+        Does nothing if it is already bound there.
 
         Args:
             texture_unit (int): Index of the texture unit. Default is 0.
         """
-        glActiveTexture(GL_TEXTURE0 + texture_unit)
-        glBindTexture(GL_TEXTURE_3D, self.texture_id)
+        bind_texture(GL_TEXTURE_3D, self.texture_id, texture_unit)
 
-    def unbind(self) -> None:
+    def unbind(self, texture_unit: int = 0) -> None:
         """
-        Unbinds the 3D texture from the active texture unit.
+        Unbinds the 3D texture from the specified texture unit.
+
+        Args:
+            texture_unit (int): Index of the texture unit. Default is 0.
+        """
+        bind_texture(GL_TEXTURE_3D, 0, texture_unit)
+
+    def _release_upload(self) -> None:
+        """
+        Deletes the staging buffer and fence of the last upload.
+        """
+        if self._upload_fence is not None:
+            glDeleteSync(self._upload_fence)
+            self._upload_fence = None
+        if self._pbo is not None:
+            glDeleteBuffers(1, [self._pbo])
+            self._pbo = None
+
+    @property
+    def is_uploaded(self) -> bool:
         """
-        glBindTexture(GL_TEXTURE_3D, 0)
+        Polls, without blocking, whether the texture data has reached the GPU.
+
+        Returns:
+            bool: True once the texture can be sampled with the new data.
+        """
+        if self._upload_fence is None:
+            return self.texture_id is not None
+
+        status = glClientWaitSync(self._upload_fence, 0, 0)
+        if status not in (GL_ALREADY_SIGNALED, GL_CONDITION_SATISFIED):
+            return False
+
+        self._release_upload()
+        return True
 
     def delete(self) -> None:
         """
         Deletes the texture from GPU memory, if it exists.
         """
+        self._release_upload()
         if self.texture_id is not None:
-            glDeleteTextures([self.texture_id])
+            delete_texture(self.texture_id)
             self.texture_id = None
 
     @property
@@ -0,0 +1,90 @@
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from volumetric_viewer.volume import Volume
+
+
+class VolumeLoader:
+    """
+    Loads volumes on a worker thread, so the render loop keeps running while a file is read.
+    """
+
+    def __init__(self, on_error: Callable[[str, Exception], None]) -> None:
+        """
+        Initializes the loader with its worker thread.
+
+        Args:
+            on_error (Callable[[str, Exception], None]): Called from :meth:`poll` with
+                the path and the error of a load that failed.
+        """
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._on_error = on_error
+        self._pending: Future | None = None
+        # Bumped by every load, a running load that no longer matches is abandoned
+        self._generation = 0
+        self.current_path: str | None = None
+
+    def load(self, reader_type, filepath: str) -> None:
+        """
+        Starts loading a volume file, unless it is already the current one.
+        A load still in progress is superseded and its result dropped.
+
+        Args:
+            reader_type: Reader class of the file format, e.g. NHDRReader.
+            filepath (str): Path of the volume file.
+        """
+        if filepath == self.current_path:
+            return
+        self.current_path = filepath
+
+        self._generation += 1
+        if self._pending is not None:
+            # Only stops a load that has not started, a running one checks the generation
+            self._pending.cancel()
+        self._pending = self._executor.submit(self._load, self._generation, reader_type, filepath)
+
+    def _load(self, generation: int, reader_type, filepath: str) -> Volume | None:
+        """
+        Reads and normalizes a volume file on the worker thread. Needs no GL context.
+
+        Args:
+            generation (int): Value of the load counter when this load was requested.
+            reader_type: Reader class of the file format, e.g. NHDRReader.
+            filepath (str): Path of the volume file.
+
+        Returns:
+            Volume | None: The normalized volume, not yet uploaded to the GPU,
+            or None if a newer load was requested meanwhile.
+        """
+        reader = reader_type(filepath)
+        # Normalizing is the expensive part, skipped once the file is no longer wanted
+        if generation != self._generation:
+            return None
+        return Volume(reader.data, reader.shape, reader.spacing)
+
+    def poll(self) -> Volume | None:
+        """
+        Collects the loaded volume, without blocking.
+
+        A failed load is reported through ``on_error`` and forgotten, so the same
+        file can be picked again.
+
+        Returns:
+            Volume | None: The loaded volume, or None if no load has finished.
+        """
+        if self._pending is None or not self._pending.done():
+            return None
+
+        future, self._pending = self._pending, None
+        try:
+            return future.result()
+        except Exception as error:
+            failed_path, self.current_path = self.current_path, None
+            self._on_error(failed_path, error)
+            return None
+
+    def shutdown(self) -> None:
+        """
+        Stops the worker thread, dropping loads that have not started.
+        """
+        self._executor.shutdown(wait=False, cancel_futures=True)
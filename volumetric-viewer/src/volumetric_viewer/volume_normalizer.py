@@ -7,17 +7,28 @@ class VolumeNormalizer:
     Provides normalization of volumetric data intensity and spatial coordinates.
     """
 
+    # Number of X slices quantized at a time, bounds the float32 scratch buffer
+    QUANTIZE_SLAB = 16
+
     def normalize(
         self, 
         sizes: tuple[int, int, int], 
         spacings: tuple[float, float, float], 
-        data: np.ndarray
+        data: np.ndarray,
+        dtype: type = np.float32
     ) -> tuple[np.ndarray, tuple[float, float, float]]:
         """
         Normalizes intensity values and computes spatial scaling.
 
+        Args:
+            sizes (tuple[int, int, int]): Volume dimensions (x, y, z).
+            spacings (tuple[float, float, float]): Physical voxel spacings.
+            data (np.ndarray): Raw volumetric data.
+            dtype (type): np.float32, or an unsigned integer type the densities
+                are quantized to, spanning that type's whole range.
+
         Returns:
-            normalized_data (np.ndarray): Densities between 0 and 1.
+            normalized_data (np.ndarray): Densities between 0 and 1, or quantized to dtype.
             scale_factors (tuple[float, float, float]): Normalization factor along each axis.
         """
         physical_size = (
@@ -31,6 +42,66 @@ class VolumeNormalizer:
 
         scale_factors = tuple(s * uniform_scale for s in physical_size)
 
-        normalized_data = (data - np.min(data)) / (np.max(data) - np.min(data))
+        if np.issubdtype(dtype, np.unsignedinteger):
+            return self._quantize(data, np.dtype(dtype)), scale_factors
+
+        data_min, scale = self._intensity_scale(data, 1.0)
+
+        # One float32 copy of the (possibly memory-mapped) source, normalized in place.
+        # The GL_FLOAT texture upload reads this buffer as is, without converting it again.
+        normalized_data = data.astype(np.float32)
+        normalized_data -= data_min
+        normalized_data *= scale
+
+        return normalized_data, scale_factors
+
+    def _intensity_scale(self, data: np.ndarray, max_value: float) -> tuple[float, float]:
+        """
+        Computes the offset and factor mapping the data range onto [0, max_value].
+
+        The minimum and maximum are each reduced once, as Python floats, so integer
+        sources cannot overflow when the range is taken.
+
+        Args:
+            data (np.ndarray): Raw volumetric data.
+            max_value (float): Value the data maximum is mapped to.
+
+        Returns:
+            data_min (float): Offset to subtract from the data.
+            scale (float): Factor to multiply by, 0 for a constant volume.
+        """
+        data_min = float(np.min(data))
+        data_range = float(np.max(data)) - data_min
+        scale = max_value / data_range if data_range else 0.0
+        return data_min, scale
+
+    def _quantize(self, data: np.ndarray, dtype: np.dtype) -> np.ndarray:
+        """
+        Maps the data range linearly onto the whole range of an unsigned integer type.
+
+        Works slab by slab, so no float copy of the full volume is ever allocated.
+        Data of the output type that already spans its whole range is returned unchanged.
+
+        Args:
+            data (np.ndarray): Raw volumetric data.
+            dtype (np.dtype): Unsigned integer output type.
+
+        Returns:
+            np.ndarray: The quantized densities, with the same shape as data.
+        """
+        data_min, scale = self._intensity_scale(data, np.iinfo(dtype).max)
+
+        # Data that already spans the whole output range is used as is, without a copy
+        if data.dtype == dtype and data_min == 0 and scale == 1.0:
+            return data
+
+        quantized = np.empty(data.shape, dtype=dtype)
+        for start in range(0, data.shape[0], self.QUANTIZE_SLAB):
+            end = start + self.QUANTIZE_SLAB
+            slab = data[start:end].astype(np.float32)
+            slab -= data_min
+            slab *= scale
+            np.rint(slab, out=slab)
+            quantized[start:end] = slab
 
-        return normalized_data, scale_factors
\ No newline at end of file
+        return quantized
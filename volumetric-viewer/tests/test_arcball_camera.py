@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+from pyglm import glm
+
+from volumetric_viewer.arcball_camera import ArcballCamera
+
+
+def assert_matrix_close(actual: glm.mat4, expected: glm.mat4) -> None:
+    assert np.allclose(actual.to_list(), expected.to_list(), atol=1e-6)
+
+
+def test_should_rebuild_view_matrix_only_when_requested() -> None:
+    camera = ArcballCamera(target=glm.vec3(0.5, 0.5, 0.5), distance=2.5)
+
+    view = camera.get_view_matrix()
+    expected = glm.lookAt(camera.position, camera.target, camera.up)
+    assert_matrix_close(view, expected)
+
+    camera.process_mouse(10.0, 5.0)
+    camera.process_mouse(-3.0, 2.0)
+    camera.process_scroll(0.5)
+
+    # Input is deferred, camera state only changes once the matrix is requested
+    assert camera.yaw == -135.0
+    assert camera.distance == 2.5
+
+    view = camera.get_view_matrix()
+    assert view != expected
+    assert_matrix_close(view, glm.lookAt(camera.position, camera.target, camera.up))
+    assert glm.distance(camera.position, camera.target) == pytest.approx(2.0, abs=1e-5)
+
+
+def test_should_coalesce_input_events_into_single_update() -> None:
+    coalesced = ArcballCamera(target=glm.vec3(0.5, 0.5, 0.5), distance=2.5)
+    stepped = ArcballCamera(target=glm.vec3(0.5, 0.5, 0.5), distance=2.5)
+
+    for dx, dy in [(4.0, 1.0), (6.0, -2.0), (1.5, 0.5)]:
+        coalesced.process_mouse(dx, dy)
+    coalesced.process_scroll(0.25)
+    coalesced.process_scroll(0.25)
+
+    stepped.process_mouse(11.5, -0.5)
+    stepped.process_scroll(0.5)
+
+    assert coalesced.get_view_matrix() == stepped.get_view_matrix()
+    assert coalesced.yaw == pytest.approx(stepped.yaw)
+    assert coalesced.pitch == pytest.approx(stepped.pitch)
+    assert coalesced.distance == pytest.approx(2.0)
+
+
+def test_should_orbit_origin_when_no_target_is_given() -> None:
+    camera = ArcballCamera(target=None)
+
+    camera.get_view_matrix()
+
+    assert camera.target == glm.vec3(0, 0, 0)
+    assert glm.length(camera.position) == pytest.approx(3.0, abs=1e-5)
+
+
+def test_should_invalidate_view_matrix_when_state_is_assigned() -> None:
+    camera = ArcballCamera(target=glm.vec3(0.5, 0.5, 0.5), distance=2.5)
+    view = camera.view_matrix
+    assert camera.view_matrix is view
+
+    camera.yaw = 45.0
+    camera.target = glm.vec3(0, 0, 0)
+
+    view = camera.view_matrix
+    assert_matrix_close(view, glm.lookAt(camera.position, camera.target, camera.up))
+    assert camera.position.z == pytest.approx(camera.position.x)
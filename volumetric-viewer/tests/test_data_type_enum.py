@@ -0,0 +1,18 @@
+import numpy as np
+import pytest
+
+from volumetric_viewer.data_type_enum import DataType
+
+
+def test_should_convert_strings_to_data_types() -> None:
+    assert DataType.from_string("uint8") == DataType.UINT8
+    assert DataType.from_string("Float32") == DataType.FLOAT32
+
+    with pytest.raises(ValueError, match="Invalid type 'complex64'"):
+        DataType.from_string("complex64")
+
+
+def test_should_expose_precomputed_numpy_dtypes() -> None:
+    assert DataType.UINT16.dtype == np.dtype(np.uint16)
+    assert DataType.UINT16.itemsize == 2
+    assert DataType.FLOAT64.itemsize == 8
@@ -0,0 +1,64 @@
+import pickle
+import time
+
+from volumetric_viewer.event_system import (
+    ColorChangedEvent,
+    EventQueue,
+    MinIsovalueChangedEvent,
+    ProcessEventQueue,
+    TransferFunctionUpdateEvent,
+    ViewModeChangedEvent,
+)
+
+
+def test_should_pop_all_events_in_push_order() -> None:
+    queue = EventQueue()
+    events = [
+        ColorChangedEvent((1.0, 0.5, 0.5)),
+        MinIsovalueChangedEvent(10),
+        ViewModeChangedEvent(1),
+    ]
+
+    for event in events:
+        queue.push(event)
+
+    assert queue.pop_all() == events
+    assert queue.pop_all() == []
+
+
+def test_should_try_pop_events_until_empty() -> None:
+    queue = EventQueue()
+    assert queue.try_pop() is None
+
+    first = MinIsovalueChangedEvent(10)
+    second = MinIsovalueChangedEvent(20)
+    queue.push(first)
+    queue.push(second)
+
+    assert queue.try_pop() is first
+    assert queue.try_pop() is second
+    assert queue.try_pop() is None
+
+
+def test_should_pickle_events_sent_to_gui_process() -> None:
+    event = TransferFunctionUpdateEvent({
+        "alpha_knots": [(0.0, 0.0), (255.0, 1.0)],
+        "color_knots": [(0.0, 1.0, 0.0, 0.0), (255.0, 0.0, 0.0, 1.0)],
+    })
+
+    assert pickle.loads(pickle.dumps(event)) == event
+
+
+def test_should_try_pop_events_from_process_queue() -> None:
+    queue = ProcessEventQueue()
+    assert queue.try_pop() is None
+
+    queue.push(MinIsovalueChangedEvent(10))
+
+    # The queue's feeder thread delivers asynchronously
+    deadline = time.monotonic() + 5.0
+    while (event := queue.try_pop()) is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert event == MinIsovalueChangedEvent(10)
+    assert queue.try_pop() is None
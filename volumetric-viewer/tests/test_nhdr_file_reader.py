@@ -31,5 +31,18 @@ def test_should_read_nrrd_files() -> None:
         "ea8ab897880147d2a79dc7f1d1806a34b32853074eca88f6758e01382469f9f6"
     )
 
-    actual_sha512 = hashlib.sha512(reader.data.tobytes()).hexdigest()
+    # Hashed straight from the mapped buffer, without copying the volume
+    actual_sha512 = hashlib.sha512(memoryview(reader.data).cast("B")).hexdigest()
     assert actual_sha512 == expected_sha512
+
+
+def test_should_parse_nhdr_header_without_reading_data() -> None:
+    current_dir = Path(__file__).parent
+    lobster_file = (current_dir / ".." / "data" / "lobster.nhdr").resolve()
+
+    reader = NHDRReader(str(lobster_file))
+
+    assert reader.shape == (301, 324, 56)
+    assert reader.spacing == (1.0, 1.0, 1.4)
+    assert reader.endian == "little"
+    assert reader.data_file_path == str(lobster_file.parent / "lobster_301x324x56_uint8.raw")
@@ -1,6 +1,9 @@
 import hashlib
 import os
 
+import numpy as np
+import pytest
+
 from volumetric_viewer.data_type_enum import DataType
 from volumetric_viewer.raw_parser import RawParser
 
@@ -21,5 +24,24 @@ def test_should_parse_raw_files():
 
     sha512_value = "5ee3d77ae951e129d29062a4fd4d8730fd8670bdaf4d01ddf907848072180cbfea8ab897880147d2a79dc7f1d1806a34b32853074eca88f6758e01382469f9f6"
     sha512 = hashlib.sha512()
-    sha512.update(tooth_data.tobytes())
+    sha512.update(memoryview(tooth_data).cast("B"))
     assert sha512.hexdigest() == sha512_value
+
+
+def test_should_reject_raw_files_with_unexpected_size(tmp_path):
+    raw_file = tmp_path / "volume_4x4x4_uint16.raw"
+    raw_file.write_bytes(bytes(4 * 4 * 4))
+    parser = RawParser(str(raw_file))
+
+    with pytest.raises(ValueError, match="expected 64 elements, got 32"):
+        parser.read_data()
+
+
+def test_should_read_big_endian_raw_files(tmp_path):
+    values = np.arange(8, dtype=np.uint16).reshape((2, 2, 2)) * 257 + 1
+    raw_file = tmp_path / "volume_2x2x2_uint16.raw"
+    raw_file.write_bytes(values.astype(">u2").tobytes())
+
+    data = RawParser(str(raw_file), endian="big").read_data()
+
+    assert np.array_equal(data, values)
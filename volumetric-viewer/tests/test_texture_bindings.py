@@ -0,0 +1,41 @@
+import pytest
+from OpenGL.GL import GL_TEXTURE0, GL_TEXTURE_1D, GL_TEXTURE_3D
+
+from volumetric_viewer import texture_bindings
+
+
+@pytest.fixture
+def gl_calls(monkeypatch: pytest.MonkeyPatch) -> list[tuple]:
+    calls = []
+    monkeypatch.setattr(texture_bindings, "_active_unit", 0)
+    monkeypatch.setattr(texture_bindings, "_bound_textures", {})
+    monkeypatch.setattr(texture_bindings, "glActiveTexture", lambda unit: calls.append(("active", unit)))
+    monkeypatch.setattr(texture_bindings, "glBindTexture", lambda target, tex: calls.append(("bind", target, tex)))
+    monkeypatch.setattr(texture_bindings, "glDeleteTextures", lambda textures: calls.append(("delete", *textures)))
+    return calls
+
+
+def test_should_skip_bindings_that_are_already_current(gl_calls: list[tuple]) -> None:
+    texture_bindings.bind_texture(GL_TEXTURE_3D, 5, 0)
+    texture_bindings.bind_texture(GL_TEXTURE_1D, 7, 1)
+    texture_bindings.bind_texture(GL_TEXTURE_3D, 5, 0)
+    texture_bindings.bind_texture(GL_TEXTURE_1D, 7, 1)
+
+    assert gl_calls == [
+        ("bind", GL_TEXTURE_3D, 5),
+        ("active", GL_TEXTURE0 + 1),
+        ("bind", GL_TEXTURE_1D, 7),
+    ]
+
+
+def test_should_rebind_after_texture_is_deleted(gl_calls: list[tuple]) -> None:
+    texture_bindings.bind_texture(GL_TEXTURE_3D, 5, 0)
+    texture_bindings.delete_texture(5)
+    # The id may be handed out again by the next create_texture
+    texture_bindings.bind_texture(GL_TEXTURE_3D, 5, 0)
+
+    assert gl_calls == [
+        ("bind", GL_TEXTURE_3D, 5),
+        ("delete", 5),
+        ("bind", GL_TEXTURE_3D, 5),
+    ]
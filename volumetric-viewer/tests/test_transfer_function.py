@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from volumetric_viewer.transfer_function import TransferFunction
+
+
+def test_should_interpolate_knots_into_texture_data() -> None:
+    transfer_function = TransferFunction(size=256)
+    transfer_function.color_knots = [(0, 1.0, 0.0, 0.0), (100, 0.0, 1.0, 0.0), (255, 0.0, 0.0, 1.0)]
+    transfer_function.alpha_knots = [(50, 0.0), (150, 1.0)]
+
+    tf_data = transfer_function.generate_texture_data()
+
+    assert tf_data.shape == (256, 4)
+    assert tf_data.dtype == np.float32
+    assert np.allclose(tf_data[0], [1.0, 0.0, 0.0, 0.0])
+    assert np.allclose(tf_data[50], [0.5, 0.5, 0.0, 0.0])
+    assert np.allclose(tf_data[100], [0.0, 1.0, 0.0, 0.5])
+    assert np.allclose(tf_data[255], [0.0, 0.0, 1.0, 1.0])
+
+
+def test_should_leave_channels_empty_without_knots() -> None:
+    transfer_function = TransferFunction(size=16)
+    transfer_function.alpha_knots = [(0, 0.25)]
+
+    tf_data = transfer_function.generate_texture_data()
+
+    assert np.array_equal(tf_data[:, :3], np.zeros((16, 3), dtype=np.float32))
+    assert np.allclose(tf_data[:, 3], 0.25)
+
+
+def test_should_keep_knots_sorted_by_intensity() -> None:
+    transfer_function = TransferFunction()
+
+    for intensity, alpha in [(200, 0.5), (10, 0.1), (120, 0.3), (10, 0.2)]:
+        transfer_function.add_alpha_knot(alpha, intensity)
+    transfer_function.add_color_knot(0.0, 0.0, 1.0, 255)
+    transfer_function.add_color_knot(1.0, 0.0, 0.0, 0)
+
+    assert transfer_function.alpha_knots == [(10, 0.1), (10, 0.2), (120, 0.3), (200, 0.5)]
+    assert transfer_function.color_knots == [(0, 1.0, 0.0, 0.0), (255, 0.0, 0.0, 1.0)]
+
+
+def test_should_regenerate_texture_data_when_knots_are_replaced() -> None:
+    transfer_function = TransferFunction(size=16)
+    transfer_function.alpha_knots = [(0, 0.0), (15, 1.0)]
+    first = transfer_function.generate_texture_data()
+    assert np.isclose(first[15, 3], 1.0)
+
+    transfer_function.alpha_knots = [(0, 0.5)]
+    transfer_function.add_color_knot(0.0, 1.0, 0.0, 8)
+    second = transfer_function.generate_texture_data()
+
+    assert second is first
+    assert np.allclose(second[:, 3], 0.5)
+    assert np.allclose(second[:, :3], [0.0, 1.0, 0.0])
+
+
+def test_should_sort_updated_knots_without_mutating_caller(monkeypatch: pytest.MonkeyPatch) -> None:
+    transfer_function = TransferFunction(size=16)
+    monkeypatch.setattr(transfer_function, "upload_to_gpu", lambda: None)
+    alpha_knots = [(15, 1.0), (0, 0.0)]
+    color_knots = np.array([[15, 0.0, 0.0, 1.0], [0, 1.0, 0.0, 0.0]], dtype=np.float32)
+
+    transfer_function.update(color_knots, alpha_knots)
+    transfer_function.update(alpha_knots=((8, 0.5), (0, 0.25)))
+
+    assert alpha_knots == [(15, 1.0), (0, 0.0)]
+    assert transfer_function.alpha_knots == [(0, 0.25), (8, 0.5)]
+    assert [knot[0] for knot in transfer_function.color_knots] == [0, 15]
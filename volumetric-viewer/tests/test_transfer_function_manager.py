@@ -0,0 +1,24 @@
+from pathlib import Path
+
+from volumetric_viewer.transfer_function_manager import TransferFunctionManager
+
+
+def test_should_read_alpha_knots_and_skip_other_lines(tmp_path: Path) -> None:
+    tf_file = tmp_path / "transfer_function.txt"
+    tf_file.write_text("0 0.0\n10.5 0.25 1 2\n\n128 0.5\n255 1\n")
+    colors = [(0, 1.0, 0.0, 0.0), (255, 0.0, 0.0, 1.0)]
+
+    data = TransferFunctionManager().read_file(str(tf_file), colors)
+
+    assert data["alpha_knots"] == [(0.0, 0.0), (128.0, 0.5), (255.0, 1.0)]
+    assert all(isinstance(knot, tuple) for knot in data["alpha_knots"])
+    assert data["color_knots"] is colors
+
+
+def test_should_read_empty_file_without_knots(tmp_path: Path) -> None:
+    tf_file = tmp_path / "transfer_function.txt"
+    tf_file.write_text("")
+
+    data = TransferFunctionManager().read_file(str(tf_file), [])
+
+    assert data["alpha_knots"] == []
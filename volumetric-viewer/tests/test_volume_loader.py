@@ -0,0 +1,97 @@
+import threading
+import time
+
+import numpy as np
+
+from volumetric_viewer.volume_loader import VolumeLoader
+
+
+class ArrayReader:
+    def __init__(self, filepath: str) -> None:
+        self.data = np.arange(8, dtype=np.uint8).reshape((2, 2, 2))
+        self.shape = (2, 2, 2)
+        self.spacing = (1.0, 1.0, 1.0)
+
+
+class FailingReader:
+    def __init__(self, filepath: str) -> None:
+        raise ValueError(f"Unexpected size of {filepath}")
+
+
+def poll_until_done(loader: VolumeLoader, errors: list) -> object:
+    reported = len(errors)
+    for _ in range(500):
+        if (volume := loader.poll()) is not None or len(errors) > reported:
+            return volume
+        time.sleep(0.01)
+    raise TimeoutError("Volume load did not finish")
+
+
+def test_should_load_volume_in_background() -> None:
+    errors = []
+    loader = VolumeLoader(lambda path, error: errors.append((path, error)))
+
+    loader.load(ArrayReader, "volume.raw")
+    volume = poll_until_done(loader, errors)
+    loader.shutdown()
+
+    assert errors == []
+    assert volume.sizes == (2, 2, 2)
+    assert loader.poll() is None
+
+
+def test_should_report_failed_load_and_allow_retry() -> None:
+    errors = []
+    loader = VolumeLoader(lambda path, error: errors.append((path, error)))
+
+    loader.load(FailingReader, "broken.raw")
+    assert poll_until_done(loader, errors) is None
+
+    assert len(errors) == 1
+    assert errors[0][0] == "broken.raw"
+    assert isinstance(errors[0][1], ValueError)
+    assert loader.current_path is None
+
+    # Picking the same file again starts a new load instead of being ignored
+    loader.load(FailingReader, "broken.raw")
+    poll_until_done(loader, errors)
+    loader.shutdown()
+
+    assert [path for path, _ in errors] == ["broken.raw", "broken.raw"]
+
+
+def test_should_drop_load_superseded_while_running() -> None:
+    started = threading.Event()
+    release = threading.Event()
+    built = []
+
+    class BlockingReader(ArrayReader):
+        def __init__(self, filepath: str) -> None:
+            super().__init__(filepath)
+            started.set()
+            release.wait(timeout=5)
+
+        @property
+        def data(self) -> np.ndarray:
+            built.append(True)
+            return self._data
+
+        @data.setter
+        def data(self, value: np.ndarray) -> None:
+            self._data = value
+
+    errors = []
+    loader = VolumeLoader(lambda path, error: errors.append((path, error)))
+
+    loader.load(BlockingReader, "first.raw")
+    assert started.wait(timeout=5)
+    loader.load(ArrayReader, "second.raw")
+    release.set()
+
+    volume = poll_until_done(loader, errors)
+    loader.shutdown()
+
+    assert errors == []
+    assert volume.sizes == (2, 2, 2)
+    # The first load was abandoned before its volume was normalized
+    assert built == []
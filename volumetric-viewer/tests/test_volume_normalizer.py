@@ -41,4 +41,36 @@ def test_should_normalize_volume():
     # Check if normalized data has the same shape as the original data
     assert normalized_data.shape == reader.data.shape, (
         "Normalized data shape differs from the original data shape"
-    )
\ No newline at end of file
+    )
+
+def test_should_quantize_float_volume_to_uint8():
+    sizes = (20, 3, 2)
+    data = np.linspace(-1.0, 3.0, 120, dtype=np.float32).reshape(sizes)
+    normalizer = VolumeNormalizer()
+
+    normalized_data, _ = normalizer.normalize(sizes, (1.0, 1.0, 1.0), data)
+    quantized_data, _ = normalizer.normalize(sizes, (1.0, 1.0, 1.0), data, dtype=np.uint8)
+
+    assert quantized_data.dtype == np.uint8
+    assert quantized_data.shape == sizes
+    assert quantized_data.min() == 0
+    assert quantized_data.max() == 255
+    assert np.array_equal(quantized_data, np.rint(normalized_data * 255).astype(np.uint8))
+
+
+def test_should_normalize_full_int16_range_without_overflow():
+    sizes = (2, 1, 1)
+    data = np.array([-30000, 30000], dtype=np.int16).reshape(sizes)
+
+    normalized_data, _ = VolumeNormalizer().normalize(sizes, (1.0, 1.0, 1.0), data)
+
+    assert np.allclose(normalized_data.ravel(), [0.0, 1.0])
+
+
+def test_should_keep_full_range_uint8_volume_without_copy():
+    sizes = (2, 2, 1)
+    data = np.array([0, 10, 200, 255], dtype=np.uint8).reshape(sizes)
+
+    normalized_data, _ = VolumeNormalizer().normalize(sizes, (1.0, 1.0, 1.0), data, dtype=np.uint8)
+
+    assert normalized_data is data